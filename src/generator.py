@@ -2,11 +2,21 @@
 Генератор ответов — собирает промпт и вызывает LLM
 """
 
+import re
 from typing import Dict, List
 from config import SYSTEM_PROMPT, PROMPT_TEMPLATES, KNOWLEDGE
 from knowledge.retriever import get_retriever
 
 
+# Китайские/японские/корейские символы
+_CJK_RE = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf\u3040-\u309f\u30a0-\u30ff]')
+# Иероглифы + китайская пунктуация (。，！？：；「」『』【】)
+_CJK_WITH_PUNCT_RE = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf\u3040-\u309f\u30a0-\u30ff\u3000-\u303f\uff00-\uffef]+')
+# Английские слова (минимум 2 латинские буквы подряд)
+_ENGLISH_WORD_RE = re.compile(r'\b[a-zA-Z]{2,}\b')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 class ResponseGenerator:
     def __init__(self, llm):
         self.llm = llm
@@ -48,18 +58,16 @@ class ResponseGenerator:
     
     def _has_chinese(self, text: str) -> bool:
         """Проверяем есть ли китайские/японские/корейские символы"""
-        import re
-        return bool(re.search(r'[\u4e00-\u9fff\u3400-\u4dbf\u3040-\u309f\u30a0-\u30ff]', text))
+        return bool(_CJK_RE.search(text))
 
     def _has_english(self, text: str) -> bool:
         """Проверяем есть ли английские слова (минимум 2 буквы подряд)"""
-        import re
         # Ищем английские слова (минимум 2 латинские буквы подряд)
         # Исключаем: CRM, API, OK, ID и подобные аббревиатуры
         allowed_english = {'crm', 'api', 'ok', 'id', 'ip', 'sms', 'email', 'excel', 'whatsapp', 'telegram', 'hr'}
 
         # Находим все английские слова
-        english_words = re.findall(r'\b[a-zA-Z]{2,}\b', text)
+        english_words = _ENGLISH_WORD_RE.findall(text)
 
         # Проверяем есть ли недопустимые английские слова
         for word in english_words:
@@ -162,8 +170,6 @@ class ResponseGenerator:
     
     def _clean(self, text: str) -> str:
         """Убираем лишнее и фильтруем нерусский текст"""
-        import re
-
         text = text.strip()
 
         # Убираем префиксы
@@ -173,7 +179,7 @@ class ResponseGenerator:
 
         # Удаляем китайские/японские/корейские символы и пунктуацию (Qwen иногда переключается)
         # Иероглифы + китайская пунктуация (。，！？：；「」『』【】)
-        text = re.sub(r'[\u4e00-\u9fff\u3400-\u4dbf\u3040-\u309f\u30a0-\u30ff\u3000-\u303f\uff00-\uffef]+', '', text)
+        text = _CJK_WITH_PUNCT_RE.sub('', text)
 
         # Удаляем английские слова (кроме разрешённых)
         allowed_english = {'crm', 'api', 'ok', 'id', 'ip', 'sms', 'email', 'excel', 'whatsapp', 'telegram', 'hr'}
@@ -184,7 +190,7 @@ class ResponseGenerator:
                 return word
             return ''
 
-        text = re.sub(r'\b[a-zA-Z]{2,}\b', replace_english, text)
+        text = _ENGLISH_WORD_RE.sub(replace_english, text)
 
         # Удаляем строки начинающиеся с извинений на китайском
         lines = text.split('\n')
@@ -202,7 +208,7 @@ class ResponseGenerator:
         text = '\n'.join(cleaned_lines)
 
         # Убираем лишние пробелы
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
 
         return text
 
@@ -9,7 +9,7 @@
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -21,9 +21,6 @@ class KnowledgeSection:
     facts: str              # Текст с фактами
     priority: int = 5       # 1-10, выше = важнее при конфликтах
 
-    # Для эмбеддингов (заполняется автоматически)
-    embedding: Optional[List[float]] = field(default=None, repr=False)
-
 
 @dataclass
 class KnowledgeBase:
@@ -32,13 +29,23 @@ class KnowledgeBase:
     company_description: str
     sections: List[KnowledgeSection]
 
+    # Индексы по позициям разделов (строятся один раз, sections после создания не меняются)
+    _category_index: Dict[str, List[int]] = field(init=False, repr=False, compare=False)
+    _topic_index: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._category_index = {}
+        self._topic_index = {}
+        for i, s in enumerate(self.sections):
+            self._category_index.setdefault(s.category, []).append(i)
+            # При повторе темы побеждает первый раздел, как при переборе
+            self._topic_index.setdefault(s.topic, i)
+
     def get_by_category(self, category: str) -> List[KnowledgeSection]:
         """Получить все разделы категории"""
-        return [s for s in self.sections if s.category == category]
+        return [self.sections[i] for i in self._category_index.get(category, ())]
 
     def get_by_topic(self, topic: str) -> Optional[KnowledgeSection]:
         """Получить раздел по теме"""
-        for s in self.sections:
-            if s.topic == topic:
-                return s
-        return None
+        i = self._topic_index.get(topic)
+        return None if i is None else self.sections[i]
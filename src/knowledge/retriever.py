@@ -3,12 +3,14 @@
 
 Стратегия:
 1. Быстрый поиск по ключевым словам (детерминированный)
-2. Fallback на эмбеддинги если не нашли (опционально)
-3. Возвращает только релевантные факты
+2. Fallback на BM25 по тексту разделов если не нашли (опционально, bm25s)
+3. Fallback на эмбеддинги если не нашли (опционально)
+4. Возвращает только релевантные факты
 """
 
 import re
-from typing import List, Optional, Tuple
+import functools
+from typing import Dict, List, Optional, Tuple
 from .base import KnowledgeSection
 from .data import WIPON_KNOWLEDGE
 
@@ -25,19 +27,63 @@ INTENT_TO_CATEGORY = {
     "rejection": [],  # Не нужны факты
 }
 
+# Маркер "интент неизвестен" (в отличие от пустого списка — "факты не нужны")
+_UNKNOWN_INTENT = object()
+
+# Ключевые слова раскладываем по первым буквам: в каждой позиции сообщения
+# проверяем только слова, которые начинаются с тех же букв
+_KEYWORD_PREFIX_LEN = 4
+
+
+@functools.lru_cache(maxsize=None)
+def _keyword_word_re(keyword_lower: str) -> re.Pattern:
+    """Regex "ключевое слово целиком" — компилируем один раз на слово"""
+    return re.compile(rf'\b{re.escape(keyword_lower)}\b', re.IGNORECASE)
+
 
 class KnowledgeRetriever:
-    """Гибридный retriever: keywords + embeddings (опционально)"""
+    """Гибридный retriever: keywords + BM25 и embeddings (опционально)"""
 
-    def __init__(self, use_embeddings: bool = False):
+    def __init__(self, use_embeddings: bool = False, use_bm25: bool = False):
         self.kb = WIPON_KNOWLEDGE
         self.use_embeddings = use_embeddings
+        self.use_bm25 = use_bm25
         self.embedder = None
         self.np = None
+        # Эмбеддинги разделов в int8 (строка на раздел) + масштаб и норма строки
+        self._embeddings_int8 = None
+        self._embedding_scales = None
+        self._embedding_norms = None
+        self.bm25 = None
+        self._bm25s = None
+        self._build_keyword_index()
+
+        # Кэш поиска: база знаний и индексы после инициализации не меняются,
+        # поэтому результат зависит только от аргументов (state в поиске не участвует)
+        self._retrieve = functools.lru_cache(maxsize=512)(self._retrieve_impl)
+
+        if use_bm25:
+            self._init_bm25()
 
         if use_embeddings:
             self._init_embeddings()
 
+    def _init_bm25(self):
+        """Инициализация BM25-индекса по ключевым словам и фактам (опционально)"""
+        try:
+            import bm25s
+            self._bm25s = bm25s
+            # Веса термов считаются при индексации, запрос — разреженное скалярное произведение
+            corpus = [" ".join(s.keywords) + "\n" + s.facts for s in self.kb.sections]
+            self.bm25 = bm25s.BM25()
+            self.bm25.index(bm25s.tokenize(corpus, stopwords="ru", show_progress=False),
+                            show_progress=False)
+
+            print(f"[KnowledgeRetriever] Indexed {len(corpus)} sections with BM25")
+        except ImportError:
+            print("[KnowledgeRetriever] bm25s not installed, using keywords only")
+            self.use_bm25 = False
+
     def _init_embeddings(self):
         """Инициализация модели эмбеддингов (опционально)"""
         try:
@@ -49,15 +95,58 @@ class KnowledgeRetriever:
 
             # Индексируем все секции
             texts = [s.facts for s in self.kb.sections]
-            embeddings = self.embedder.encode(texts)
-            for i, section in enumerate(self.kb.sections):
-                section.embedding = embeddings[i].tolist()
+            self._index_embeddings(self.embedder.encode(texts))
 
             print(f"[KnowledgeRetriever] Indexed {len(texts)} sections with embeddings")
         except ImportError:
             print("[KnowledgeRetriever] sentence-transformers not installed, using keywords only")
             self.use_embeddings = False
 
+    def _index_embeddings(self, embeddings) -> None:
+        """Эмбеддинги разделов → int8 с масштабом на строку (в 4 раза меньше float32)"""
+        np = self.np
+        self._embeddings_int8, self._embedding_scales = self._quantize(
+            np.asarray(embeddings, dtype=np.float32))
+        # Норма деквантованной строки: косинус считается по тем же значениям, что и скалярное произведение
+        self._embedding_norms = (
+            np.linalg.norm(self._embeddings_int8.astype(np.float32), axis=1) * self._embedding_scales
+        )
+
+    def _quantize(self, vectors):
+        """float32 → (int8, масштаб): симметрично, масштаб на строку (или на вектор)"""
+        np = self.np
+        scales = np.abs(vectors).max(axis=-1) / 127
+        scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+        quantized = np.round(vectors / scales[..., None]).astype(np.int8)
+        return quantized, scales
+
+    def _build_keyword_index(self):
+        """Индексы для поиска: строятся один раз, а не на каждый запрос"""
+        # Ключевое слово в lowercase → позиции разделов (с повторами: каждое вхождение даёт балл)
+        self._keyword_sections: Dict[str, List[int]] = {}
+        # Первые буквы → ключевые слова
+        self._keywords_by_prefix: Dict[str, List[str]] = {}
+        self._section_positions: Dict[int, int] = {}
+
+        for position, section in enumerate(self.kb.sections):
+            self._section_positions[id(section)] = position
+            for keyword in section.keywords:
+                keyword_lower = keyword.lower()
+                if keyword_lower not in self._keyword_sections:
+                    self._keywords_by_prefix.setdefault(
+                        keyword_lower[:_KEYWORD_PREFIX_LEN], []).append(keyword_lower)
+                self._keyword_sections.setdefault(keyword_lower, []).append(position)
+
+    def _find_keywords(self, message_lower: str) -> set:
+        """Все ключевые слова, которые входят в сообщение подстрокой"""
+        found = set()
+        for i in range(len(message_lower)):
+            for length in range(1, _KEYWORD_PREFIX_LEN + 1):
+                for keyword in self._keywords_by_prefix.get(message_lower[i:i + length], ()):
+                    if message_lower.startswith(keyword, i):
+                        found.add(keyword)
+        return found
+
     def retrieve(
         self,
         message: str,
@@ -77,16 +166,24 @@ class KnowledgeRetriever:
         Returns:
             Строка с фактами или пустая строка
         """
-        message_lower = message.lower()
+        return self._retrieve(message, intent, top_k)
 
+    def _retrieve_impl(self, message: str, intent: Optional[str], top_k: int) -> str:
+        """Поиск фактов без кэша (см. retrieve)"""
         # Шаг 1: Сужаем область поиска по интенту
-        categories = INTENT_TO_CATEGORY.get(intent, [])
-        if categories:
+        categories = INTENT_TO_CATEGORY.get(intent, _UNKNOWN_INTENT)
+        if categories is _UNKNOWN_INTENT:
+            # Интент неизвестен — ищем по всем секциям
+            candidate_sections = self.kb.sections
+        elif not categories:
+            # Интент известен, но факты не нужны (greeting, rejection)
+            return ""
+        else:
             candidate_sections = []
             for cat in categories:
                 candidate_sections.extend(self.kb.get_by_category(cat))
-        else:
-            candidate_sections = self.kb.sections
+
+        message_lower = message.lower()
 
         if not candidate_sections:
             return ""
@@ -94,14 +191,18 @@ class KnowledgeRetriever:
         # Шаг 2: Поиск по ключевым словам
         scored_sections = self._keyword_search(message_lower, candidate_sections)
 
-        # Шаг 3: Если не нашли и есть эмбеддинги — семантический поиск
+        # Шаг 3: Если не нашли — BM25 по тексту разделов
+        if not scored_sections and self.use_bm25:
+            scored_sections = self._bm25_search(message, candidate_sections)
+
+        # Шаг 4: Если всё ещё не нашли и есть эмбеддинги — семантический поиск
         if not scored_sections and self.use_embeddings:
             scored_sections = self._semantic_search(message, candidate_sections, top_k)
 
-        # Шаг 4: Сортируем по score и priority
+        # Шаг 5: Сортируем по score и priority
         scored_sections.sort(key=lambda x: (x[0], x[1].priority), reverse=True)
 
-        # Шаг 5: Возвращаем топ-K
+        # Шаг 6: Возвращаем топ-K
         results = []
         for score, section in scored_sections[:top_k]:
             if score > 0:
@@ -109,29 +210,71 @@ class KnowledgeRetriever:
 
         return "\n\n---\n\n".join(results) if results else ""
 
+    def retrieve_many(
+        self,
+        messages: List[str],
+        intent: str = None,
+        state: str = None,
+        top_k: int = 2
+    ) -> List[str]:
+        """
+        Найти факты для пачки сообщений с общим интентом
+
+        Одинаковые сообщения ищем один раз. Результат — как у retrieve()
+        для каждого сообщения, в том же порядке.
+        """
+        found: Dict[str, str] = {}
+        for message in messages:
+            if message not in found:
+                found[message] = self.retrieve(message, intent, state, top_k)
+        return [found[message] for message in messages]
+
     def _keyword_search(
         self,
         message_lower: str,
         sections: List[KnowledgeSection]
     ) -> List[Tuple[float, KnowledgeSection]]:
         """Поиск по ключевым словам"""
-        results = []
+        # Баллы считаем только для разделов, чьи ключевые слова нашлись в сообщении
+        scores: Dict[int, float] = {}
+        for keyword_lower in self._find_keywords(message_lower):
+            score = 1
+            # Бонус за точное совпадение слова
+            if _keyword_word_re(keyword_lower).search(message_lower):
+                score += 0.5
+            for position in self._keyword_sections[keyword_lower]:
+                scores[position] = scores.get(position, 0.0) + score
 
+        results = []
         for section in sections:
-            score = 0.0
-            for keyword in section.keywords:
-                keyword_lower = keyword.lower()
-                if keyword_lower in message_lower:
-                    score += 1
-                    # Бонус за точное совпадение слова
-                    if re.search(rf'\b{re.escape(keyword_lower)}\b', message_lower, re.IGNORECASE):
-                        score += 0.5
-
+            score = scores.get(self._section_positions.get(id(section)), 0.0)
             if score > 0:
                 results.append((score, section))
 
         return results
 
+    def _bm25_search(
+        self,
+        message: str,
+        sections: List[KnowledgeSection]
+    ) -> List[Tuple[float, KnowledgeSection]]:
+        """Лексический поиск BM25 по тексту разделов"""
+        if not self.bm25:
+            return []
+
+        query_tokens = self._bm25s.tokenize([message], stopwords="ru",
+                                            return_ids=False, show_progress=False)[0]
+        if not query_tokens:
+            return []
+        scores = self.bm25.get_scores(query_tokens)
+
+        results = []
+        for section in sections:
+            score = float(scores[self._section_positions[id(section)]])
+            if score > 0:
+                results.append((score, section))
+        return results
+
     def _semantic_search(
         self,
         message: str,
@@ -139,24 +282,33 @@ class KnowledgeRetriever:
         top_k: int
     ) -> List[Tuple[float, KnowledgeSection]]:
         """Семантический поиск по эмбеддингам"""
-        if not self.embedder or not self.np:
+        if not self.embedder or not self.np or self._embeddings_int8 is None:
             return []
 
-        query_emb = self.embedder.encode(message)
-        results = []
+        query_emb = self.np.asarray(self.embedder.encode(message), dtype=self.np.float32)
+        positions = [self._section_positions[id(section)] for section in sections]
+        scores = self._semantic_scores(query_emb, positions)
 
-        for section in sections:
-            if section.embedding:
-                # Косинусное сходство
-                section_emb = self.np.array(section.embedding)
-                score = self.np.dot(query_emb, section_emb) / (
-                    self.np.linalg.norm(query_emb) * self.np.linalg.norm(section_emb)
-                )
-                if score > 0.4:  # Порог релевантности
-                    results.append((float(score), section))
+        results = []
+        for section, score in zip(sections, scores):
+            if score > 0.4:  # Порог релевантности
+                results.append((float(score), section))
 
         return sorted(results, key=lambda x: x[0], reverse=True)[:top_k]
 
+    def _semantic_scores(self, query_emb, positions: List[int]):
+        """Косинусное сходство запроса с разделами на позициях positions
+
+        Запрос тоже квантуется в int8, скалярные произведения считаются
+        в целых (накопление в int32) прямо по int8-матрице — без float32-копии.
+        """
+        np = self.np
+        query_int8, query_scale = self._quantize(query_emb)
+        dots = np.einsum("ij,j->i", self._embeddings_int8, query_int8, dtype=np.int32)[positions]
+        norms = self._embedding_norms[positions] * (
+            np.linalg.norm(query_int8.astype(np.float32)) * query_scale)
+        return dots * (self._embedding_scales[positions] * query_scale) / np.where(norms > 0, norms, 1.0)
+
     def get_company_info(self) -> str:
         """Получить базовую информацию о компании"""
         return f"{self.kb.company_name}: {self.kb.company_description}"
@@ -13,6 +13,9 @@ from config import SALES_STATES, QUESTION_INTENTS
 # SPIN-фазы и их порядок
 SPIN_PHASES = ["situation", "problem", "implication", "need_payoff"]
 
+# Позиция фазы в SPIN_PHASES (вместо list.index на каждом переходе)
+SPIN_PHASE_ORDER = {phase: i for i, phase in enumerate(SPIN_PHASES)}
+
 # Состояния SPIN
 SPIN_STATES = {
     "situation": "spin_situation",
@@ -54,10 +57,10 @@ class StateMachine:
 
     def _get_next_spin_state(self, current_phase: str) -> Optional[str]:
         """Определяем следующее SPIN-состояние"""
-        if current_phase not in SPIN_PHASES:
+        current_idx = SPIN_PHASE_ORDER.get(current_phase)
+        if current_idx is None:
             return None
 
-        current_idx = SPIN_PHASES.index(current_phase)
         if current_idx < len(SPIN_PHASES) - 1:
             next_phase = SPIN_PHASES[current_idx + 1]
             return SPIN_STATES.get(next_phase)
@@ -129,9 +132,11 @@ class StateMachine:
             # Проверяем SPIN-специфичные интенты для перехода
             if intent in SPIN_PROGRESS_INTENTS:
                 intent_phase = SPIN_PROGRESS_INTENTS[intent]
+                intent_idx = SPIN_PHASE_ORDER.get(intent_phase)
+                phase_idx = SPIN_PHASE_ORDER.get(spin_phase)
                 # Если интент соответствует текущей или следующей фазе — это прогресс
                 if intent_phase == spin_phase or \
-                   (SPIN_PHASES.index(intent_phase) > SPIN_PHASES.index(spin_phase) if intent_phase in SPIN_PHASES and spin_phase in SPIN_PHASES else False):
+                   (intent_idx is not None and phase_idx is not None and intent_idx > phase_idx):
                     # Проверяем можно ли перейти дальше
                     transitions = config.get("transitions", {})
                     if intent in transitions:
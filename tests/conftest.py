@@ -0,0 +1,32 @@
+"""
+Общая настройка pytest для тестов CRM Sales Bot
+"""
+
+# Путь к src/ задаёт pythonpath в pyproject.toml
+
+import pytest
+
+
+# =============================================================================
+# ОБЩИЕ ФИКСТУРЫ
+# =============================================================================
+# Классификатор, экстрактор и retriever не хранят состояние между вызовами —
+# создаём их один раз на сессию (при pytest -n auto — один раз на воркер).
+
+@pytest.fixture(scope="session")
+def classifier():
+    from classifier import HybridClassifier
+    return HybridClassifier()
+
+
+@pytest.fixture(scope="session")
+def extractor():
+    from classifier import DataExtractor
+    return DataExtractor()
+
+
+@pytest.fixture(scope="session")
+def retriever():
+    """Retriever без эмбеддингов для быстрых тестов"""
+    from knowledge.retriever import KnowledgeRetriever
+    return KnowledgeRetriever(use_embeddings=False)
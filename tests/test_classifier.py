@@ -8,502 +8,639 @@
 - HybridClassifier: контекстная классификация коротких ответов
 """
 
+import random
+import re
 import pytest
-import sys
-sys.path.insert(0, 'src')
 
+import classifier as classifier_module
 from classifier import (
     TextNormalizer,
     HybridClassifier,
-    DataExtractor,
     TYPO_FIXES,
     SPLIT_PATTERNS,
     PRIORITY_PATTERNS,
+    _COMPILED_PRIORITY_PATTERNS,
+    _EXTRACT_PREFILTER,
+    SHORT_ANSWER_FLAGS,
+    _short_answer_flags,
+    _match_priority_pattern,
+    _trie_regex,
 )
 
 
+# =============================================================================
+# ФИКСТУРЫ
+# =============================================================================
+# classifier и extractor — общие на сессию, см. conftest.py
+
+@pytest.fixture(scope="module")
+def normalizer():
+    return TextNormalizer()
+
+
+@pytest.fixture(scope="module")
+def warm_classifier(classifier):
+    """
+    Классификатор, уже прошедший все ветки classify()
+
+    Первые вызовы наполняют кэши pymorphy и кэши классификатора —
+    эта разовая цена не должна попадать в граничные тесты.
+    """
+    classifier.classify_many(
+        ["сколько стоит", "да", "у нас 10 человек", "теряем клиентов", "расскажите подробнее"],
+        [None, {"last_bot_intent": "offer_demo"}, {"spin_phase": "situation"},
+         {"spin_phase": "problem"}, None],
+    )
+    return classifier
+
+
 class TestTextNormalizer:
     """Тесты для нормализатора текста"""
 
-    def setup_method(self):
-        self.normalizer = TextNormalizer()
-
     # =========================================================================
     # TYPO_FIXES: Опечатки и сленг
     # =========================================================================
 
-    def test_price_typos(self):
+    @pytest.mark.parametrize("text,expected", [
+        ("скока стоит", "сколько"),
+        ("скоко это", "сколько"),
+        ("какой ценик", "ценник"),
+        ("скиньте прайсик", "прайс"),
+        ("какой тарифчик", "тариф"),
+    ])
+    def test_price_typos(self, normalizer, text, expected):
         """Ценовые опечатки нормализуются"""
-        assert "сколько" in self.normalizer.normalize("скока стоит")
-        assert "сколько" in self.normalizer.normalize("скоко это")
-        assert "ценник" in self.normalizer.normalize("какой ценик")
-        assert "прайс" in self.normalizer.normalize("скиньте прайсик")
-        assert "тариф" in self.normalizer.normalize("какой тарифчик")
-
-    def test_greeting_typos(self):
+        assert expected in normalizer.normalize(text)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("прив", "привет"),
+        ("хай", "привет"),
+        ("хаюшки", "привет"),
+        ("здрасте", "здравствуйте"),
+        ("дратути", "здравствуйте"),
+    ])
+    def test_greeting_typos(self, normalizer, text, expected):
         """Приветствия нормализуются"""
-        assert "привет" in self.normalizer.normalize("прив")
-        assert "привет" in self.normalizer.normalize("хай")
-        assert "привет" in self.normalizer.normalize("хаюшки")
-        assert "здравствуйте" in self.normalizer.normalize("здрасте")
-        assert "здравствуйте" in self.normalizer.normalize("дратути")
-
-    def test_farewell_typos(self):
+        assert expected in normalizer.normalize(text)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("покеда", "пока"),
+        ("бай", "пока"),
+        ("удачки", "удачи"),
+    ])
+    def test_farewell_typos(self, normalizer, text, expected):
         """Прощания нормализуются"""
-        assert "пока" in self.normalizer.normalize("покеда")
-        assert "пока" in self.normalizer.normalize("бай")
-        assert "удачи" in self.normalizer.normalize("удачки")
-
-    def test_slang_words(self):
+        assert expected in normalizer.normalize(text)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("че там", "что"),
+        ("чо надо", "что"),
+        ("щас", "сейчас"),
+        ("ваще", "вообще"),
+        ("норм", "нормально"),
+        ("ок", "хорошо"),
+        ("окей", "хорошо"),
+    ])
+    def test_slang_words(self, normalizer, text, expected):
         """Сленговые слова нормализуются"""
-        assert "что" in self.normalizer.normalize("че там")
-        assert "что" in self.normalizer.normalize("чо надо")
-        assert "сейчас" in self.normalizer.normalize("щас")
-        assert "вообще" in self.normalizer.normalize("ваще")
-        assert "нормально" in self.normalizer.normalize("норм")
-        assert "хорошо" in self.normalizer.normalize("ок")
-        assert "хорошо" in self.normalizer.normalize("окей")
-
-    def test_thanks_typos(self):
+        assert expected in normalizer.normalize(text)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("спс", "спасибо"),
+        ("пасиб", "спасибо"),
+        ("плиз", "пожалуйста"),
+        ("пж", "пожалуйста"),
+    ])
+    def test_thanks_typos(self, normalizer, text, expected):
         """Благодарности нормализуются"""
-        assert "спасибо" in self.normalizer.normalize("спс")
-        assert "спасибо" in self.normalizer.normalize("пасиб")
-        assert "пожалуйста" in self.normalizer.normalize("плиз")
-        assert "пожалуйста" in self.normalizer.normalize("пж")
+        assert expected in normalizer.normalize(text)
 
-    def test_agreement_slang(self):
+    def test_agreement_slang(self, normalizer):
         """Согласие в сленговой форме"""
-        assert "да" in self.normalizer.normalize("ага")
-        assert "да" in self.normalizer.normalize("угу")
-        assert "точно" in self.normalizer.normalize("точняк")
+        assert "да" in normalizer.normalize("ага")
+        assert "да" in normalizer.normalize("угу")
+        assert "точно" in normalizer.normalize("точняк")
         # "канеш" может разбиваться split-паттерном
-        normalized = self.normalizer.normalize("канеш")
+        normalized = normalizer.normalize("канеш")
         assert "коне" in normalized or "конечно" in normalized
 
-    def test_negation_slang(self):
+    @pytest.mark.parametrize("text,expected", [
+        ("неа", "нет"),
+        ("ноуп", "нет"),
+        ("врятли", "вряд ли"),
+    ])
+    def test_negation_slang(self, normalizer, text, expected):
         """Отрицание в сленговой форме"""
-        assert "нет" in self.normalizer.normalize("неа")
-        assert "нет" in self.normalizer.normalize("ноуп")
-        assert "вряд ли" in self.normalizer.normalize("врятли")
-
-    def test_emotion_slang(self):
+        assert expected in normalizer.normalize(text)
+
+    @pytest.mark.parametrize("text,expected", [
+        ("збс", "отлично"),
+        ("огонь", "отлично"),
+        ("топчик", "отлично"),
+        ("кайф", "хорошо"),
+        ("хз", "не знаю"),
+    ])
+    def test_emotion_slang(self, normalizer, text, expected):
         """Эмоциональные слова и сленг"""
-        assert "отлично" in self.normalizer.normalize("збс")
-        assert "отлично" in self.normalizer.normalize("огонь")
-        assert "отлично" in self.normalizer.normalize("топчик")
-        assert "хорошо" in self.normalizer.normalize("кайф")
-        assert "не знаю" in self.normalizer.normalize("хз")
+        assert expected in normalizer.normalize(text)
 
-    def test_business_terms(self):
+    def test_business_terms(self, normalizer):
         """Бизнес-термины нормализуются"""
         # Case-insensitive check for CRM
-        assert "crm" in self.normalizer.normalize("црмка").lower()
-        assert "битрикс" in self.normalizer.normalize("битрик")
+        assert "crm" in normalizer.normalize("црмка").lower()
+        assert "битрикс" in normalizer.normalize("битрик")
         # "манагер" может разбиваться split-паттерном
-        normalized = self.normalizer.normalize("манагер")
+        normalized = normalizer.normalize("манагер")
         assert "мене" in normalized or "менеджер" in normalized
 
     # =========================================================================
     # TYPO_FIXES: Раскладка клавиатуры
     # =========================================================================
 
-    def test_keyboard_layout_en_to_ru(self):
+    @pytest.mark.parametrize("text,expected", [
+        ("ghbdtn", "привет"),
+        ("wtyf", "цена"),
+        ("ghfqc", "прайс"),
+        ("lf", "да"),
+        ("ytn", "нет"),
+    ])
+    def test_keyboard_layout_en_to_ru(self, normalizer, text, expected):
         """Английская раскладка → русская"""
-        assert "привет" in self.normalizer.normalize("ghbdtn")
-        assert "цена" in self.normalizer.normalize("wtyf")
-        assert "прайс" in self.normalizer.normalize("ghfqc")
-        assert "да" in self.normalizer.normalize("lf")
-        assert "нет" in self.normalizer.normalize("ytn")
+        assert expected in normalizer.normalize(text)
+
+    def test_ascii_and_unicode_paths_agree(self, normalizer):
+        """Латинское слово обрабатывается одинаково в ASCII- и смешанном тексте"""
+        assert normalizer.normalize("ghbdtn") == "привет"
+        assert normalizer.normalize("ghbdtn друг").split()[0] == "привет"
+        assert normalizer.normalize("OOOOK") == normalizer.normalize("ooook")
 
     # =========================================================================
     # SPLIT_PATTERNS: Слипшиеся слова
     # =========================================================================
 
-    def test_split_question_words(self):
+    def test_split_question_words(self, normalizer):
         """Вопросительные слова разделяются"""
-        normalized = self.normalizer.normalize("скольковсего")
+        normalized = normalizer.normalize("скольковсего")
         assert " " in normalized or "сколько" in normalized
 
-        normalized = self.normalizer.normalize("какаяцена")
+        normalized = normalizer.normalize("какаяцена")
         assert " " in normalized or "какая" in normalized
 
-    def test_split_action_verbs(self):
+    def test_split_action_verbs(self, normalizer):
         """Глаголы действий разделяются"""
-        normalized = self.normalizer.normalize("хочуузнать")
+        normalized = normalizer.normalize("хочуузнать")
         assert " " in normalized or "хочу" in normalized
 
-        normalized = self.normalizer.normalize("можнопосмотреть")
+        normalized = normalizer.normalize("можнопосмотреть")
         assert " " in normalized or "можно" in normalized
 
-    def test_split_greetings(self):
+    def test_split_greetings(self, normalizer):
         """Приветствия разделяются"""
-        normalized = self.normalizer.normalize("добрыйдень")
+        normalized = normalizer.normalize("добрыйдень")
         assert " " in normalized or "добрый" in normalized
 
-    def test_split_negations(self):
+    def test_split_negations(self, normalizer):
         """Отрицания разделяются"""
-        normalized = self.normalizer.normalize("ненужно")
+        normalized = normalizer.normalize("ненужно")
         # "не" + "нужно" или остаётся слитно как rejection
         assert "не" in normalized or "ненужно" in normalized
 
+    def test_split_several_words(self, normalizer):
+        """Несколько слипшихся слов в одном сообщении"""
+        assert normalizer.normalize("нетспасибо") == "нет спасибо"
+        assert normalizer.normalize("хочуузнатьсколькостоит").endswith("сколько стоит")
+
+    def test_normalize_cached(self, normalizer):
+        """Повторная нормализация берётся из кэша"""
+        first = normalizer.normalize("ghbdtn")
+        hits = classifier_module._normalize_impl.cache_info().hits
+        assert normalizer.normalize("ghbdtn") == first
+        assert classifier_module._normalize_impl.cache_info().hits == hits + 1
+
+    def test_normalize_cache_shared_between_instances(self, normalizer):
+        """Новый нормализатор использует тот же кэш, что и существующие"""
+        normalizer.normalize("скока стоит")
+        other = TextNormalizer()
+        hits = classifier_module._normalize_impl.cache_info().hits
+        assert other.normalize("скока стоит") == normalizer.normalize("скока стоит")
+        assert classifier_module._normalize_impl.cache_info().hits == hits + 2
+
+    def test_canonical_fast_path_matches_full_pipeline(self, normalizer, monkeypatch):
+        """Быстрый путь для канонического текста даёт то же, что полный конвейер"""
+        rng = random.Random(0)
+        vocabulary = sorted(set(TYPO_FIXES) | set(TYPO_FIXES.values()))
+        vocabulary += ["перезвоните", "мне", "хочу", "демо", "пока", "Сколько", "10", "crm?"]
+        messages = [" ".join(rng.sample(vocabulary, rng.randint(1, 4))) for _ in range(500)]
+
+        normalize_uncached = classifier_module._normalize_impl.__wrapped__
+        fast = [normalize_uncached(m) for m in messages]
+        monkeypatch.setattr(classifier_module, "_needs_normalization", lambda text: True)
+        assert fast == [normalize_uncached(m) for m in messages]
+
+    def test_split_trigger_regex(self):
+        """Trie-regex совпадает ровно со словами из списка"""
+        pattern = re.compile(_trie_regex(["не", "нет", "ни", "сколько"]))
+        for word in ["не", "нет", "ни", "сколько"]:
+            assert pattern.fullmatch(word)
+        for word in ["н", "нетт", "скол", ""]:
+            assert not pattern.fullmatch(word)
+
+
+# =============================================================================
+# НЕОДНОЗНАЧНЫЕ ФРАЗЫ: (сообщение, допустимые интенты)
+# =============================================================================
+
+AMBIGUOUS_INTENT_CASES = [
+    # Надо подумать: objection_think или info_provided
+    ("Мне надо подумать", {"objection_think", "info_provided"}),
+    ("Дайте подумать над предложением", {"objection_think", "info_provided"}),
+    # Обсудить с коллегами
+    ("Мне нужно посовещаться", {"objection_think", "info_provided", "rejection"}),
+    ("Надо обсудить с руководством", {"objection_think", "info_provided", "rejection"}),
+    # Прощание: farewell или agreement
+    ("До свидания", {"farewell", "agreement"}),
+    ("До связи пока", {"farewell", "agreement"}),
+    # Благодарность: gratitude или agreement
+    ("Большое спасибо!", {"gratitude", "agreement"}),
+    ("Благодарю вас", {"gratitude", "agreement"}),
+]
+
 
 class TestPriorityPatterns:
     """Тесты для приоритетных паттернов классификации"""
 
-    def setup_method(self):
-        self.classifier = HybridClassifier()
-
     # =========================================================================
     # CALLBACK REQUEST
     # =========================================================================
 
-    def test_callback_direct(self):
+    @pytest.mark.parametrize("message", [
+        "Перезвоните мне",
+        "Позвоните нам",
+    ])
+    def test_callback_direct(self, classifier, message):
         """Прямой запрос обратного звонка"""
-        result = self.classifier.classify("Перезвоните мне")
-        assert result["intent"] == "callback_request"
+        assert classifier.classify(message)["intent"] == "callback_request"
 
-        result = self.classifier.classify("Позвоните нам")
-        assert result["intent"] == "callback_request"
-
-    def test_callback_polite(self):
+    @pytest.mark.parametrize("message", [
+        "Можете перезвонить?",
+        "Свяжитесь со мной",
+    ])
+    def test_callback_polite(self, classifier, message):
         """Вежливый запрос обратного звонка"""
-        result = self.classifier.classify("Можете перезвонить?")
-        assert result["intent"] == "callback_request"
-
-        result = self.classifier.classify("Свяжитесь со мной")
-        assert result["intent"] == "callback_request"
+        assert classifier.classify(message)["intent"] == "callback_request"
 
-    def test_callback_with_number(self):
+    def test_callback_with_number(self, classifier):
         """Запрос с указанием номера"""
         # "Вот мой номер" может не распознаваться без контекста
         # Используем более явные фразы
-        result = self.classifier.classify("Запишите номер, перезвоните мне")
+        result = classifier.classify("Запишите номер, перезвоните мне")
         assert result["intent"] == "callback_request"
 
-        result = self.classifier.classify("Наберите меня по этому номеру")
+        result = classifier.classify("Наберите меня по этому номеру")
         assert result["intent"] == "callback_request"
 
     # =========================================================================
     # DEMO REQUEST
     # =========================================================================
 
-    def test_demo_direct(self):
+    @pytest.mark.parametrize("message", [
+        "Хочу демо",
+        "Покажите демо версию",
+    ])
+    def test_demo_direct(self, classifier, message):
         """Прямой запрос демо"""
-        result = self.classifier.classify("Хочу демо")
-        assert result["intent"] == "demo_request"
-
-        result = self.classifier.classify("Покажите демо версию")
-        assert result["intent"] == "demo_request"
+        assert classifier.classify(message)["intent"] == "demo_request"
 
-    def test_demo_trial(self):
+    @pytest.mark.parametrize("message", [
+        "Дайте демо доступ",
+        "Хочу демо версию",
+    ])
+    def test_demo_trial(self, classifier, message):
         """Запрос пробного периода"""
-        result = self.classifier.classify("Дайте демо доступ")
-        assert result["intent"] == "demo_request"
-
-        result = self.classifier.classify("Хочу демо версию")
-        assert result["intent"] == "demo_request"
+        assert classifier.classify(message)["intent"] == "demo_request"
 
-    def test_demo_see_work(self):
+    @pytest.mark.parametrize("message", [
+        "Нужно демо",
+        "Дайте демо",
+    ])
+    def test_demo_see_work(self, classifier, message):
         """Запрос посмотреть как работает"""
-        result = self.classifier.classify("Нужно демо")
-        assert result["intent"] == "demo_request"
-
-        result = self.classifier.classify("Дайте демо")
-        assert result["intent"] == "demo_request"
+        assert classifier.classify(message)["intent"] == "demo_request"
 
     # =========================================================================
     # CONSULTATION REQUEST
     # =========================================================================
 
-    def test_consultation_direct(self):
+    def test_consultation_direct(self, classifier):
         """Прямой запрос консультации"""
-        result = self.classifier.classify("Нужна консультация")
+        result = classifier.classify("Нужна консультация")
         assert result["intent"] == "consultation_request"
 
-        result = self.classifier.classify("Можете проконсультировать?")
+        result = classifier.classify("Можете проконсультировать?")
         assert result["intent"] == "consultation_request"
 
-    def test_consultation_help(self):
+    def test_consultation_help(self, classifier):
         """Запрос помощи в выборе"""
-        result = self.classifier.classify("Помогите разобраться")
+        result = classifier.classify("Помогите разобраться")
         assert result["intent"] == "consultation_request"
 
-        result = self.classifier.classify("Посоветуйте что лучше")
+        result = classifier.classify("Посоветуйте что лучше")
         assert result["intent"] == "consultation_request"
 
     # =========================================================================
     # COMPARISON (сравнение с конкурентами)
     # =========================================================================
 
-    def test_comparison_direct(self):
+    def test_comparison_direct(self, classifier):
         """Прямое сравнение"""
-        result = self.classifier.classify("Чем лучше от amoCRM?")
+        result = classifier.classify("Чем лучше от amoCRM?")
         assert result["intent"] == "comparison"
 
-        result = self.classifier.classify("Сравните с Битрикс24")
+        result = classifier.classify("Сравните с Битрикс24")
         assert result["intent"] == "comparison"
 
-    def test_comparison_why(self):
+    def test_comparison_why(self, classifier):
         """Почему вы, а не конкуренты"""
-        result = self.classifier.classify("Почему вас, а не амо?")
+        result = classifier.classify("Почему вас, а не амо?")
         assert result["intent"] == "comparison"
 
-    def test_comparison_vs(self):
+    def test_comparison_vs(self, classifier):
         """Прямое противопоставление"""
-        result = self.classifier.classify("Вы или Мегаплан?")
+        result = classifier.classify("Вы или Мегаплан?")
         assert result["intent"] == "comparison"
 
     # =========================================================================
     # PRICING DETAILS
     # =========================================================================
 
-    def test_pricing_what_included(self):
+    @pytest.mark.parametrize("message", [
+        "Что входит в цену тарифа?",
+        "Дайте прайс-лист",
+    ])
+    def test_pricing_what_included(self, classifier, message):
         """Что входит в стоимость"""
-        result = self.classifier.classify("Что входит в цену тарифа?")
-        assert result["intent"] == "pricing_details"
+        assert classifier.classify(message)["intent"] == "pricing_details"
 
-        result = self.classifier.classify("Дайте прайс-лист")
-        assert result["intent"] == "pricing_details"
-
-    def test_pricing_per_user(self):
+    def test_pricing_per_user(self, classifier):
         """Цена за пользователя"""
-        result = self.classifier.classify("Сколько за одного пользователя?")
+        result = classifier.classify("Сколько за одного пользователя?")
         assert result["intent"] == "pricing_details"
 
-    def test_pricing_discounts(self):
+    def test_pricing_discounts(self, classifier):
         """Вопрос о скидках"""
-        result = self.classifier.classify("Какие скидки есть?")
+        result = classifier.classify("Какие скидки есть?")
         assert result["intent"] == "pricing_details"
 
-    def test_pricing_payment_options(self):
+    def test_pricing_payment_options(self, classifier):
         """Способы оплаты"""
-        result = self.classifier.classify("Условия оплаты?")
+        result = classifier.classify("Условия оплаты?")
         assert result["intent"] == "pricing_details"
 
     # =========================================================================
     # REJECTION
     # =========================================================================
 
-    def test_rejection_not_interested(self):
+    @pytest.mark.parametrize("message", [
+        "Не интересно",
+        "Неинтересно",
+    ])
+    def test_rejection_not_interested(self, classifier, message):
         """Не интересно"""
-        result = self.classifier.classify("Не интересно")
-        assert result["intent"] == "rejection"
-
-        result = self.classifier.classify("Неинтересно")
-        assert result["intent"] == "rejection"
+        assert classifier.classify(message)["intent"] == "rejection"
 
-    def test_rejection_not_needed(self):
+    @pytest.mark.parametrize("message", [
+        "Спасибо, не нужно",
+        "Нет, не хочу",
+    ])
+    def test_rejection_not_needed(self, classifier, message):
         """Не нужно"""
-        result = self.classifier.classify("Спасибо, не нужно")
-        assert result["intent"] == "rejection"
-
-        result = self.classifier.classify("Нет, не хочу")
-        assert result["intent"] == "rejection"
+        assert classifier.classify(message)["intent"] == "rejection"
 
-    def test_rejection_spam(self):
+    @pytest.mark.parametrize("message", [
+        "Это спам, отпишите меня",
+        "Удалите меня из рассылки",
+    ])
+    def test_rejection_spam(self, classifier, message):
         """Пометка как спам"""
-        result = self.classifier.classify("Это спам, отпишите меня")
-        assert result["intent"] == "rejection"
+        assert classifier.classify(message)["intent"] == "rejection"
 
-        result = self.classifier.classify("Удалите меня из рассылки")
-        assert result["intent"] == "rejection"
-
-    def test_rejection_stop(self):
+    @pytest.mark.parametrize("message", [
+        "Больше не пишите мне",
+        "Прекратите звонить мне",
+    ])
+    def test_rejection_stop(self, classifier, message):
         """Просьба прекратить"""
-        result = self.classifier.classify("Больше не пишите мне")
-        assert result["intent"] == "rejection"
-
-        result = self.classifier.classify("Прекратите звонить мне")
-        assert result["intent"] == "rejection"
+        assert classifier.classify(message)["intent"] == "rejection"
 
-    def test_rejection_wrong_person(self):
+    @pytest.mark.parametrize("message", [
+        "Отстаньте от меня",
+        "Мимо, не интересует",
+    ])
+    def test_rejection_wrong_person(self, classifier, message):
         """Ошиблись адресатом"""
-        result = self.classifier.classify("Отстаньте от меня")
-        assert result["intent"] == "rejection"
-
-        result = self.classifier.classify("Мимо, не интересует")
-        assert result["intent"] == "rejection"
+        assert classifier.classify(message)["intent"] == "rejection"
 
     # =========================================================================
     # OBJECTION_PRICE
     # =========================================================================
 
-    def test_objection_price_no_budget(self):
+    @pytest.mark.parametrize("message", [
+        "Нет бюджета",
+        "Бюджета нет",
+    ])
+    def test_objection_price_no_budget(self, classifier, message):
         """Нет бюджета"""
-        result = self.classifier.classify("Нет бюджета")
-        assert result["intent"] == "objection_price"
+        assert classifier.classify(message)["intent"] == "objection_price"
 
-        result = self.classifier.classify("Бюджета нет")
-        assert result["intent"] == "objection_price"
-
-    def test_objection_price_too_expensive(self):
+    @pytest.mark.parametrize("message", [
+        "Слишком дорого",
+        "Очень дорого для нас",
+    ])
+    def test_objection_price_too_expensive(self, classifier, message):
         """Слишком дорого"""
-        result = self.classifier.classify("Слишком дорого")
-        assert result["intent"] == "objection_price"
+        assert classifier.classify(message)["intent"] == "objection_price"
 
-        result = self.classifier.classify("Очень дорого для нас")
-        assert result["intent"] == "objection_price"
-
-    def test_objection_price_no_money(self):
+    @pytest.mark.parametrize("message", [
+        "Денег нет",
+        "Нет денег",
+    ])
+    def test_objection_price_no_money(self, classifier, message):
         """Нет денег"""
-        result = self.classifier.classify("Денег нет")
-        assert result["intent"] == "objection_price"
+        assert classifier.classify(message)["intent"] == "objection_price"
 
-        result = self.classifier.classify("Нет денег")
-        assert result["intent"] == "objection_price"
-
-    def test_objection_price_cant_afford(self):
+    def test_objection_price_cant_afford(self, classifier):
         """Не потянем"""
-        result = self.classifier.classify("Не потянем такую сумму")
+        result = classifier.classify("Не потянем такую сумму")
         assert result["intent"] == "objection_price"
 
     # =========================================================================
     # OBJECTION_NO_TIME
     # =========================================================================
 
-    def test_objection_no_time_busy(self):
+    def test_objection_no_time_busy(self, classifier):
         """Нет времени"""
-        result = self.classifier.classify("Сейчас некогда")
+        result = classifier.classify("Сейчас некогда")
         assert result["intent"] == "objection_no_time"
 
-        result = self.classifier.classify("Нет времени")
+        result = classifier.classify("Нет времени")
         assert result["intent"] == "objection_no_time"
 
-    def test_objection_no_time_later(self):
+    def test_objection_no_time_later(self, classifier):
         """Позже / потом"""
-        result = self.classifier.classify("Давайте потом")
+        result = classifier.classify("Давайте потом")
         assert result["intent"] == "objection_no_time"
 
-        result = self.classifier.classify("Позже свяжемся")
+        result = classifier.classify("Позже свяжемся")
         assert result["intent"] == "objection_no_time"
 
     # =========================================================================
-    # OBJECTION_THINK
+    # НЕОДНОЗНАЧНЫЕ ФРАЗЫ (допустимо несколько интентов)
     # =========================================================================
 
-    def test_objection_think_need_time(self):
-        """Надо подумать"""
-        result = self.classifier.classify("Мне надо подумать")
-        # Может классифицироваться как objection_think или info_provided
-        assert result["intent"] in ["objection_think", "info_provided"]
-
-        result = self.classifier.classify("Дайте подумать над предложением")
-        assert result["intent"] in ["objection_think", "info_provided"]
-
-    def test_objection_think_discuss(self):
-        """Обсудить с коллегами"""
-        result = self.classifier.classify("Мне нужно посовещаться")
-        assert result["intent"] in ["objection_think", "info_provided", "rejection"]
-
-        result = self.classifier.classify("Надо обсудить с руководством")
-        assert result["intent"] in ["objection_think", "info_provided", "rejection"]
+    @pytest.mark.parametrize("msg,allowed", AMBIGUOUS_INTENT_CASES)
+    def test_ambiguous_intent(self, classifier, msg, allowed):
+        """Фраза классифицируется одним из допустимых интентов"""
+        assert classifier.classify(msg)["intent"] in allowed
 
     # =========================================================================
     # FAREWELL
     # =========================================================================
 
-    def test_farewell_goodbye(self):
-        """Прощание"""
-        result = self.classifier.classify("До свидания")
-        # Может быть farewell или agreement
-        assert result["intent"] in ["farewell", "agreement"]
-
-        result = self.classifier.classify("До связи пока")
-        assert result["intent"] in ["farewell", "agreement"]
-
-    def test_farewell_bye(self):
+    def test_farewell_bye(self, classifier):
         """Короткое прощание"""
-        result = self.classifier.classify("Пока")
+        result = classifier.classify("Пока")
         assert result["intent"] == "farewell"
 
-    # =========================================================================
-    # GRATITUDE
-    # =========================================================================
-
-    def test_gratitude_thanks(self):
-        """Благодарность"""
-        result = self.classifier.classify("Большое спасибо!")
-        # Может быть gratitude или agreement
-        assert result["intent"] in ["gratitude", "agreement"]
-
-        result = self.classifier.classify("Благодарю вас")
-        assert result["intent"] in ["gratitude", "agreement"]
-
     # =========================================================================
     # SMALL_TALK
     # =========================================================================
 
-    def test_small_talk_how_are_you(self):
+    def test_small_talk_how_are_you(self, classifier):
         """Как дела"""
-        result = self.classifier.classify("Как дела?")
+        result = classifier.classify("Как дела?")
         assert result["intent"] == "small_talk"
 
-        result = self.classifier.classify("Как жизнь?")
+        result = classifier.classify("Как жизнь?")
         assert result["intent"] == "small_talk"
 
     # =========================================================================
     # QUESTION_FEATURES
     # =========================================================================
 
-    def test_question_features_what_is(self):
+    def test_question_features_what_is(self, classifier):
         """Что это такое"""
-        result = self.classifier.classify("Что такое Wipon?")
+        result = classifier.classify("Что такое Wipon?")
         assert result["intent"] == "question_features"
 
-    def test_question_features_how_works(self):
+    def test_question_features_how_works(self, classifier):
         """Как работает"""
-        result = self.classifier.classify("Как это работает?")
+        result = classifier.classify("Как это работает?")
         assert result["intent"] == "question_features"
 
-    def test_question_features_capabilities(self):
+    def test_question_features_capabilities(self, classifier):
         """Какие возможности"""
-        result = self.classifier.classify("Какие функции есть?")
+        result = classifier.classify("Какие функции есть?")
         assert result["intent"] == "question_features"
 
+    # =========================================================================
+    # ПРЕФИЛЬТР ПО ЛИТЕРАЛАМ
+    # =========================================================================
+
+    @pytest.mark.parametrize("message", [
+        "не интересно",
+        "дорого",
+        "это дорого?",
+        "а чем вы лучше iiko",
+        "перезвоните после праздников",
+        "???",
+        "да",
+        "ну да",
+        "сколько стоит за одного пользователя",
+        "нам нужно время на раздумья, а пока до свидания",
+        "просто текст без паттернов",
+        "",
+    ])
+    def test_prefilter_matches_sequential_scan(self, message):
+        """Префильтр выбирает тот же паттерн, что и перебор по порядку"""
+        expected = None
+        for pattern, intent, confidence in _COMPILED_PRIORITY_PATTERNS:
+            if pattern.search(message):
+                expected = (intent, confidence)
+                break
+        assert _match_priority_pattern(message) == expected
+
 
 class TestDataExtractor:
     """Тесты для извлечения данных"""
 
-    def setup_method(self):
-        self.extractor = DataExtractor()
+    @pytest.mark.parametrize("message", [
+        "у нас 15 человек, теряем клиентов",
+        "тратим 3 часа в день на учёт",
+        "бюджет около 50 тысяч, я директор",
+        "пишите в whatsapp, внедрить нужно в следующем месяце",
+        "да, было бы здорово",
+        "просто текст без паттернов",
+        "",
+    ])
+    def test_prefilter_matches_sequential_scan(self, message):
+        """Префильтр находит в каждой таблице те же паттерны, что и перебор"""
+        hits = _EXTRACT_PREFILTER.scan(message)
+        for group, patterns in _EXTRACT_PREFILTER.patterns.items():
+            expected = [payload for pattern, payload in patterns if pattern.search(message)]
+            found = [payload for _, payload in _EXTRACT_PREFILTER.matches(group, message, hits)]
+            assert found == expected, group
+
+    @pytest.mark.parametrize("message", [
+        "у нас человек, менеджеров",
+        "теряем клиентов, тратим часов в день",
+        "бюджет около тысяч, до рублей, млн",
+        "+ ( ) - - , лицензий на",
+    ])
+    def test_numeric_patterns_require_digits(self, message):
+        """Числовые таблицы без цифр в сообщении не срабатывают"""
+        for group in ("company_size", "pain_impact", "budget_range", "users_count"):
+            for pattern, _ in _EXTRACT_PREFILTER.patterns[group]:
+                assert not pattern.search(message), pattern.pattern
+        for pattern in classifier_module._COMPILED_PHONE_PATTERNS:
+            assert not pattern.search(message), pattern.pattern
 
     # =========================================================================
     # URGENCY (срочность)
     # =========================================================================
 
-    def test_extract_urgency_very_urgent(self):
+    def test_extract_urgency_very_urgent(self, extractor):
         """Очень срочно"""
-        result = self.extractor.extract("Срочно нужно решение")
+        result = extractor.extract("Срочно нужно решение")
         assert result.get("urgency") in ["very_urgent", "urgent"]
 
-        result = self.extractor.extract("Горит! Нужно вчера")
+        result = extractor.extract("Горит! Нужно вчера")
         assert result.get("urgency") == "very_urgent"
 
-    def test_extract_urgency_not_urgent(self):
+    def test_extract_urgency_not_urgent(self, extractor):
         """Не срочно"""
         # Текст без срочности может не иметь поля urgency
-        result = self.extractor.extract("Пока просто изучаем рынок")
+        result = extractor.extract("Пока просто изучаем рынок")
         # Если urgency не извлечено — это ок для не-срочных случаев
         assert result.get("urgency") in [None, "not_urgent"]
 
-        result = self.extractor.extract("Мы пока просто смотрим варианты")
+        result = extractor.extract("Мы пока просто смотрим варианты")
         assert result.get("urgency") in [None, "not_urgent"]
 
     # =========================================================================
     # BUDGET (бюджет)
     # =========================================================================
 
-    def test_extract_budget_thousands(self):
+    def test_extract_budget_thousands(self, extractor):
         """Бюджет в тысячах"""
-        result = self.extractor.extract("Бюджет около 50 тысяч")
+        result = extractor.extract("Бюджет около 50 тысяч")
         budget = result.get("budget_range")
         assert budget is not None
         # Может быть диапазон или число
         assert "50" in str(budget) or budget
 
-    def test_extract_budget_qualitative(self):
+    def test_extract_budget_qualitative(self, extractor):
         """Качественная оценка бюджета"""
-        result = self.extractor.extract("Бюджет небольшой")
+        result = extractor.extract("Бюджет небольшой")
         budget = result.get("budget_range")
         assert budget is not None
 
@@ -511,19 +648,19 @@ class TestDataExtractor:
     # ROLE (должность)
     # =========================================================================
 
-    def test_extract_role_director(self):
+    def test_extract_role_director(self, extractor):
         """Директор"""
-        result = self.extractor.extract("Я директор компании")
+        result = extractor.extract("Я директор компании")
         assert result.get("role") == "director"
 
-    def test_extract_role_owner(self):
+    def test_extract_role_owner(self, extractor):
         """Владелец"""
-        result = self.extractor.extract("Я собственник бизнеса")
+        result = extractor.extract("Я собственник бизнеса")
         assert result.get("role") == "owner"
 
-    def test_extract_role_manager(self):
+    def test_extract_role_manager(self, extractor):
         """Менеджер"""
-        result = self.extractor.extract("Я руководитель отдела продаж")
+        result = extractor.extract("Я руководитель отдела продаж")
         # Может быть "head" или "sales_manager"
         assert result.get("role") in ["head", "sales_manager", "manager"]
 
@@ -531,61 +668,52 @@ class TestDataExtractor:
     # PREFERRED CHANNEL (предпочтительный канал)
     # =========================================================================
 
-    def test_extract_channel_phone(self):
-        """Предпочитают телефон"""
-        result = self.extractor.extract("Лучше позвоните")
-        assert result.get("preferred_channel") == "phone"
-
-    def test_extract_channel_whatsapp(self):
-        """Предпочитают WhatsApp"""
-        result = self.extractor.extract("Пишите в вотсап")
-        assert result.get("preferred_channel") == "whatsapp"
-
-    def test_extract_channel_telegram(self):
-        """Предпочитают Telegram"""
-        result = self.extractor.extract("Лучше в телеграм")
-        assert result.get("preferred_channel") == "telegram"
-
-    def test_extract_channel_email(self):
-        """Предпочитают email"""
-        result = self.extractor.extract("Отправьте на почту")
-        assert result.get("preferred_channel") == "email"
+    @pytest.mark.parametrize("message,expected", [
+        ("Лучше позвоните", "phone"),
+        ("Пишите в вотсап", "whatsapp"),
+        ("Лучше в телеграм", "telegram"),
+        ("Отправьте на почту", "email"),
+    ])
+    def test_extract_channel(self, extractor, message, expected):
+        """Предпочитаемый канал: телефон, WhatsApp, Telegram, email"""
+        result = extractor.extract(message)
+        assert result.get("preferred_channel") == expected
 
     # =========================================================================
     # TIMELINE (сроки)
     # =========================================================================
 
-    def test_extract_timeline_immediate(self):
+    def test_extract_timeline_immediate(self, extractor):
         """Сразу / сейчас"""
-        result = self.extractor.extract("Нужно прямо сейчас, срочно")
+        result = extractor.extract("Нужно прямо сейчас, срочно")
         # Может извлечься urgency вместо timeline или оба
         timeline = result.get("timeline")
         urgency = result.get("urgency")
         assert timeline in ["immediate", "this_week", None] or urgency is not None
 
-    def test_extract_timeline_this_month(self):
+    def test_extract_timeline_this_month(self, extractor):
         """В этом месяце"""
-        result = self.extractor.extract("Планируем в этом месяце")
+        result = extractor.extract("Планируем в этом месяце")
         assert result.get("timeline") == "this_month"
 
-    def test_extract_timeline_next_quarter(self):
+    def test_extract_timeline_next_quarter(self, extractor):
         """В следующем квартале"""
-        result = self.extractor.extract("В следующем квартале")
+        result = extractor.extract("В следующем квартале")
         assert result.get("timeline") == "next_quarter"
 
     # =========================================================================
     # USERS COUNT (количество пользователей)
     # =========================================================================
 
-    def test_extract_users_count(self):
+    def test_extract_users_count(self, extractor):
         """Количество пользователей"""
-        result = self.extractor.extract("У нас 10 сотрудников")
+        result = extractor.extract("У нас 10 сотрудников")
         # Может извлечься как company_size или users_count
         assert result.get("users_count") == 10 or result.get("company_size") == 10
 
-    def test_extract_users_count_employees(self):
+    def test_extract_users_count_employees(self, extractor):
         """Количество сотрудников"""
-        result = self.extractor.extract("У нас 25 сотрудников")
+        result = extractor.extract("У нас 25 сотрудников")
         # Может извлечься как company_size или users_count
         assert result.get("users_count") == 25 or result.get("company_size") == 25
 
@@ -593,105 +721,102 @@ class TestDataExtractor:
 class TestShortAnswerClassification:
     """Тесты для контекстной классификации коротких ответов"""
 
-    def setup_method(self):
-        self.classifier = HybridClassifier()
-
     # =========================================================================
     # DEMO CONTEXT
     # =========================================================================
 
-    def test_short_yes_after_demo_offer(self):
+    def test_short_yes_after_demo_offer(self, classifier):
         """Да после предложения демо → demo_request"""
         context = {"last_bot_intent": "offer_demo"}
-        result = self.classifier.classify("Да", context)
+        result = classifier.classify("Да", context)
         assert result["intent"] == "demo_request"
 
-    def test_short_no_after_demo_offer(self):
+    def test_short_no_after_demo_offer(self, classifier):
         """Нет после предложения демо → rejection"""
         context = {"last_bot_intent": "offer_demo"}
-        result = self.classifier.classify("Нет", context)
+        result = classifier.classify("Нет", context)
         assert result["intent"] == "rejection"
 
     # =========================================================================
     # CALLBACK CONTEXT
     # =========================================================================
 
-    def test_short_yes_after_callback_offer(self):
+    def test_short_yes_after_callback_offer(self, classifier):
         """Да после предложения созвона → callback_request"""
         context = {"last_bot_intent": "offer_call"}
-        result = self.classifier.classify("Да", context)
+        result = classifier.classify("Да", context)
         assert result["intent"] == "callback_request"
 
-    def test_short_no_after_callback_offer(self):
+    def test_short_no_after_callback_offer(self, classifier):
         """Нет после предложения созвона → rejection"""
         context = {"last_bot_intent": "offer_call"}
-        result = self.classifier.classify("Нет", context)
+        result = classifier.classify("Нет", context)
         assert result["intent"] == "rejection"
 
     # =========================================================================
     # PRICE CONTEXT
     # =========================================================================
 
-    def test_short_yes_after_price(self):
+    def test_short_yes_after_price(self, classifier):
         """Да после озвучивания цены → agreement"""
         context = {"last_bot_intent": "price_answer"}
-        result = self.classifier.classify("Хорошо", context)
+        result = classifier.classify("Хорошо", context)
         assert result["intent"] == "agreement"
 
-    def test_short_no_after_price(self):
+    def test_short_no_after_price(self, classifier):
         """Нет после озвучивания цены → objection_price"""
         context = {"last_bot_intent": "price_answer"}
-        result = self.classifier.classify("Нет", context)
+        result = classifier.classify("Нет", context)
         assert result["intent"] == "objection_price"
 
     # =========================================================================
     # SPIN PHASES
     # =========================================================================
 
-    def test_short_yes_in_situation_phase(self):
+    def test_short_yes_in_situation_phase(self, classifier):
         """Да в фазе situation → situation_provided"""
         context = {"spin_phase": "situation"}
-        result = self.classifier.classify("Да", context)
+        result = classifier.classify("Да", context)
         assert result["intent"] == "situation_provided"
 
-    def test_short_yes_in_problem_phase(self):
+    def test_short_yes_in_problem_phase(self, classifier):
         """Да в фазе problem → problem_revealed"""
         context = {"spin_phase": "problem"}
-        result = self.classifier.classify("Да", context)
+        result = classifier.classify("Да", context)
         assert result["intent"] == "problem_revealed"
 
-    def test_short_no_in_problem_phase(self):
+    def test_short_no_in_problem_phase(self, classifier):
         """Нет в фазе problem → no_problem"""
         context = {"spin_phase": "problem"}
-        result = self.classifier.classify("Нет", context)
+        result = classifier.classify("Нет", context)
         assert result["intent"] == "no_problem"
 
-    def test_short_yes_in_implication_phase(self):
+    def test_short_yes_in_implication_phase(self, classifier):
         """Да в фазе implication → implication_acknowledged"""
         context = {"spin_phase": "implication"}
-        result = self.classifier.classify("Да", context)
+        result = classifier.classify("Да", context)
         assert result["intent"] == "implication_acknowledged"
 
-    def test_short_yes_in_need_payoff_phase(self):
+    def test_short_yes_in_need_payoff_phase(self, classifier):
         """Да в фазе need_payoff → need_expressed"""
         context = {"spin_phase": "need_payoff"}
-        result = self.classifier.classify("Да", context)
+        result = classifier.classify("Да", context)
         assert result["intent"] == "need_expressed"
 
     # =========================================================================
     # NEUTRAL / THINK
     # =========================================================================
 
-    def test_short_maybe(self):
+    def test_short_maybe(self, classifier):
         """Может быть → objection_think (если сообщение очень короткое)"""
         # Короткие нейтральные ответы в контекстной классификации
-        result = self.classifier.classify("может быть", {})
+        result = classifier.classify("может быть", {})
         # Без контекста может быть разное поведение
         assert result["intent"] in ["objection_think", "agreement", "info_provided", "unclear", "question_features"]
 
-    def test_short_need_to_think(self):
+    def test_short_need_to_think(self, classifier):
         """Подумаю → objection_think (если сообщение очень короткое)"""
-        result = self.classifier.classify("подумаю", {})
+        result = classifier.classify("подумаю", {})
         # Без контекста может быть разное поведение
         assert result["intent"] in ["objection_think", "info_provided", "unclear"]
 
@@ -699,77 +824,83 @@ class TestShortAnswerClassification:
     # PRESENTATION CONTEXT
     # =========================================================================
 
-    def test_short_yes_after_presentation(self):
+    def test_short_yes_after_presentation(self, classifier):
         """Да после презентации → agreement"""
         context = {"last_bot_intent": "presentation"}
-        result = self.classifier.classify("Понятно", context)
+        result = classifier.classify("Понятно", context)
         assert result["intent"] == "agreement"
 
+    def test_cached_text_respects_context(self, classifier):
+        """Кэш по тексту не подменяет контекст: один и тот же ответ в разных контекстах"""
+        for _ in range(2):
+            assert classifier.classify("Понятно", {"last_bot_intent": "offer_demo"})["intent"] == "demo_request"
+            assert classifier.classify("Понятно", {"last_bot_intent": "offer_call"})["intent"] == "callback_request"
+
+    @pytest.mark.parametrize("answer", sorted(SHORT_ANSWER_FLAGS))
+    def test_short_answer_table_matches_markers(self, answer):
+        """Словарь коротких ответов совпадает с перебором маркеров, в т.ч. с пунктуацией"""
+        for message in (answer, answer + "!", answer + ", ", answer + "..."):
+            assert SHORT_ANSWER_FLAGS[answer] == _short_answer_flags(message)
+
 
 class TestClarificationPatterns:
     """Тесты для уточняющих паттернов (нет + позитивный контекст)"""
 
-    def setup_method(self):
-        self.classifier = HybridClassifier()
-
-    def test_no_but_interested(self):
+    def test_no_but_interested(self, classifier):
         """Нет, но интересно"""
-        result = self.classifier.classify("Нет, мне интересно другое")
+        result = classifier.classify("Нет, мне интересно другое")
         assert result["intent"] == "agreement"
 
-    def test_no_i_want(self):
+    def test_no_i_want(self, classifier):
         """Нет, я хочу..."""
-        result = self.classifier.classify("Нет, я хочу узнать больше")
+        result = classifier.classify("Нет, я хочу узнать больше")
         assert result["intent"] == "agreement"
 
-    def test_no_tell_me(self):
+    def test_no_tell_me(self, classifier):
         """Нет, расскажите..."""
-        result = self.classifier.classify("Нет, расскажите подробнее")
+        result = classifier.classify("Нет, расскажите подробнее")
         assert result["intent"] == "agreement"
 
 
+@pytest.mark.usefixtures("warm_classifier")
 class TestEdgeCases:
     """Тесты граничных случаев"""
 
-    def setup_method(self):
-        self.classifier = HybridClassifier()
-        self.normalizer = TextNormalizer()
-
-    def test_empty_message(self):
+    def test_empty_message(self, classifier):
         """Пустое сообщение"""
-        result = self.classifier.classify("")
+        result = classifier.classify("")
         assert "intent" in result
 
-    def test_only_punctuation(self):
+    def test_only_punctuation(self, classifier):
         """Только знаки препинания"""
-        result = self.classifier.classify("???")
+        result = classifier.classify("???")
         assert "intent" in result
 
-    def test_only_emoji_like(self):
+    def test_only_emoji_like(self, classifier, normalizer):
         """Сообщение типа эмодзи"""
-        normalized = self.normalizer.normalize(")")
-        result = self.classifier.classify(")")
+        normalized = normalizer.normalize(")")
+        result = classifier.classify(")")
         assert "intent" in result
 
-    def test_very_long_message(self):
+    def test_very_long_message(self, classifier):
         """Очень длинное сообщение"""
         long_msg = "Привет " * 100
-        result = self.classifier.classify(long_msg)
+        result = classifier.classify(long_msg)
         assert "intent" in result
 
-    def test_mixed_case(self):
+    def test_mixed_case(self, classifier):
         """Смешанный регистр"""
-        result = self.classifier.classify("СкОлЬкО сТоИт?")
+        result = classifier.classify("СкОлЬкО сТоИт?")
         assert result["intent"] == "price_question"
 
-    def test_extra_spaces(self):
+    def test_extra_spaces(self, classifier):
         """Лишние пробелы"""
-        result = self.classifier.classify("   сколько    стоит   ")
+        result = classifier.classify("   сколько    стоит   ")
         assert result["intent"] == "price_question"
 
-    def test_numbers_in_text(self):
+    def test_numbers_in_text(self, classifier):
         """Числа в тексте"""
-        result = self.classifier.classify("Нужно на 5 человек")
+        result = classifier.classify("Нужно на 5 человек")
         extracted = result.get("extracted_data", {})
         assert extracted.get("company_size") == 5 or extracted.get("users_count") == 5
 
@@ -777,42 +908,55 @@ class TestEdgeCases:
 class TestIntegration:
     """Интеграционные тесты для полного пайплайна"""
 
-    def setup_method(self):
-        self.classifier = HybridClassifier()
+    def test_classifiers_share_morph_analyzer(self, classifier):
+        """Словари pymorphy загружаются один раз на процесс"""
+        assert HybridClassifier().lemma_classifier.morph is classifier.lemma_classifier.morph
 
-    def test_full_pipeline_typo_to_intent(self):
+    def test_full_pipeline_typo_to_intent(self, classifier):
         """Полный путь: опечатка → нормализация → классификация"""
         # "скока стоит" → "сколько стоит" → price_question
-        result = self.classifier.classify("скока стоит")
+        result = classifier.classify("скока стоит")
         assert result["intent"] == "price_question"
 
-    def test_full_pipeline_keyboard_to_intent(self):
+    def test_full_pipeline_keyboard_to_intent(self, classifier):
         """Полный путь: неверная раскладка → классификация"""
         # "ghbdtn" (EN) → "привет" → greeting
-        result = self.classifier.classify("ghbdtn")
+        result = classifier.classify("ghbdtn")
         assert result["intent"] == "greeting"
 
-    def test_full_pipeline_slang_rejection(self):
+    def test_full_pipeline_slang_rejection(self, classifier):
         """Полный путь: сленговый отказ"""
-        result = self.classifier.classify("нет не интересно")
+        result = classifier.classify("нет не интересно")
         assert result["intent"] == "rejection"
 
-    def test_full_pipeline_slang_agreement(self):
+    def test_full_pipeline_slang_agreement(self, classifier):
         """Полный путь: сленговое согласие"""
-        result = self.classifier.classify("ок давайте")
+        result = classifier.classify("ок давайте")
         # Может быть agreement или другой позитивный интент
         assert result["intent"] in ["agreement", "demo_request", "callback_request"]
 
-    def test_context_overrides_default(self):
+    def test_context_overrides_default(self, classifier):
         """Контекст переопределяет дефолтную классификацию"""
         # "да" без контекста → agreement
-        result_no_context = self.classifier.classify("да")
+        result_no_context = classifier.classify("да")
         assert result_no_context["intent"] == "agreement"
 
         # "да" с контекстом demo_offer → demo_request
-        result_with_context = self.classifier.classify("да", {"last_bot_intent": "offer_demo"})
+        result_with_context = classifier.classify("да", {"last_bot_intent": "offer_demo"})
         assert result_with_context["intent"] == "demo_request"
 
+    def test_classify_many_matches_classify(self, classifier):
+        """Пакетная классификация даёт те же результаты, что и поштучная"""
+        messages = [msg for msg, _ in AMBIGUOUS_INTENT_CASES] + [
+            "скока стоит", "ghbdtn", "нет не интересно", "Понятно", "???", "", "10 человек",
+        ]
+        contexts = [None] * (len(messages) - 2) + [
+            {"last_bot_intent": "offer_demo"},
+            {"spin_phase": "situation"},
+        ]
+        results = classifier.classify_many(messages, contexts)
+        assert results == [classifier.classify(m, c) for m, c in zip(messages, contexts)]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""
+Тесты разбиения потокового ответа LLM на фрагменты для TTS (voice_bot/text_chunks.py)
+"""
+
+import pytest
+from text_chunks import pop_first_clause, pop_sentences
+
+
+def stream(text: str, step: int = 1):
+    """Подаём текст кусками, как токены LLM; возвращаем фрагменты, отданные в TTS
+
+    Как в VoicePipeline.run_conversation: до первого фрагмента можно отдать клаузу.
+    """
+    chunks, pending = [], ""
+    for i in range(0, len(text), step):
+        completed, pending = pop_sentences(pending + text[i:i + step])
+        if not completed and not chunks:
+            completed, pending = pop_first_clause(pending)
+        if completed:
+            chunks.append(completed)
+    if pending.strip():
+        chunks.append(pending.strip())
+    return chunks
+
+
+class TestPopSentences:
+    """Тесты выделения законченных предложений"""
+
+    def test_splits_completed_sentences(self):
+        """Законченные предложения отдаются, хвост остаётся"""
+        assert pop_sentences("Привет! Как дела? Я ") == ("Привет! Как дела?", " Я ")
+
+    def test_no_terminator(self):
+        """Без конца предложения ничего не отдаём"""
+        assert pop_sentences("Цена от") == ("", "Цена от")
+
+    @pytest.mark.parametrize("text", [
+        "Цена от 1.5 млн",
+        "Работаем с 1С 8.3 и выше",
+        "Это не нужно, т.е. можно ",
+        "Цена от 1.",
+    ])
+    def test_dot_inside_token_is_not_sentence_end(self, text):
+        """Точка в числе, версии, сокращении или в конце буфера не режет предложение"""
+        assert pop_sentences(text) == ("", text)
+
+    def test_dot_after_single_digit_ends_sentence(self):
+        """Точка после одиночной цифры — конец предложения, а не сокращение"""
+        assert pop_sentences("Тарифов 5. Выберите ") == ("Тарифов 5.", " Выберите ")
+
+    def test_exclamation_and_ellipsis(self):
+        """!, ? и многоточие перед пробелом завершают предложение"""
+        assert pop_sentences("Отлично!! Давайте... Итак") == ("Отлично!! Давайте...", " Итак")
+
+    def test_decimal_streamed_token_by_token(self):
+        """Число с точкой, пришедшее по одному символу, не разрывается"""
+        assert stream("Цена от 1.5 млн. Подключим за день.") == [
+            "Цена от 1.5 млн.", "Подключим за день."]
+
+    def test_newline_ends_sentence(self):
+        """Перевод строки завершает фрагмент"""
+        assert pop_sentences("Тарифы\nMini") == ("Тарифы", "Mini")
+
+
+class TestPopFirstClause:
+    """Тесты раннего выделения первой клаузы"""
+
+    def test_long_clause_split(self):
+        """Клауза от FIRST_CLAUSE_MIN_CHARS символов отдаётся до конца предложения"""
+        assert pop_first_clause("Добрый день, рады помочь, сейчас") == (
+            "Добрый день, рады помочь,", " сейчас")
+
+    def test_short_clause_kept(self):
+        """Короткая клауза ждёт конца предложения"""
+        assert pop_first_clause("Да, конечно") == ("", "Да, конечно")
+
+    @pytest.mark.parametrize("text", [
+        "Тариф Стандарт стоит 2,",
+        "Тариф Стандарт стоит 2,5 тысячи",
+        "Тариф Стандарт стоит 2, 5 тысячи",
+        "Время работы поддержки 9:00",
+    ])
+    def test_digit_separator_is_not_clause_end(self, text):
+        """Десятичная запятая, время и запятая после цифры не режут клаузу"""
+        assert pop_first_clause(text) == ("", text)
+
+    def test_decimal_price_streamed(self):
+        """Цена с десятичной запятой в первом предложении доходит до TTS целиком"""
+        assert stream("Тариф Стандарт стоит 2,5 тысячи тенге, подключим сегодня. Удобно?") == [
+            "Тариф Стандарт стоит 2,5 тысячи тенге,", "подключим сегодня.", "Удобно?"]
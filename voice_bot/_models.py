@@ -0,0 +1,73 @@
+"""
+Shared model instances for the voice bot scripts
+Whisper and F5-TTS are loaded once per process and configuration, so
+running the pipeline and the tests in one process doesn't load them twice
+"""
+import functools
+import os
+
+# ctranslate2 comes with faster-whisper, so no torch needed to detect the GPU
+import ctranslate2
+from faster_whisper import WhisperModel
+
+
+@functools.lru_cache(maxsize=None)
+def _load_whisper(size: str, device: str, compute_type: str) -> WhisperModel:
+    """Load Whisper for one (size, device, compute_type)"""
+    if device == "cpu":
+        return WhisperModel(
+            size,
+            device="cpu",
+            compute_type=compute_type,
+            # int8 on CPU only pays off without thread oversubscription
+            cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+            num_workers=1
+        )
+    return WhisperModel(size, device=device, compute_type=compute_type)
+
+
+def get_whisper(size: str = "base", device: str = None, compute_type: str = None) -> WhisperModel:
+    """Shared Whisper model
+
+    Without device/compute_type: GPU if possible (int8_float16 where the GPU
+    supports it, else float16), falling back to CPU int8.
+    """
+    if device is not None:
+        return _load_whisper(size, device, compute_type or "int8")
+
+    candidates = []
+    if ctranslate2.get_cuda_device_count() > 0:
+        # Tensor cores for int8 weights + fp16 activations need Ampere (CC 8.0+)
+        cuda_types = ctranslate2.get_supported_compute_types("cuda")
+        if "int8_float16" in cuda_types:
+            candidates.append(("cuda", "int8_float16"))
+        candidates.append(("cuda", "float16"))
+    candidates.append(("cpu", "int8"))
+
+    for device, compute_type in candidates[:-1]:
+        try:
+            model = _load_whisper(size, device, compute_type)
+            print(f"   Whisper: {device} ({compute_type})")
+            return model
+        except (ValueError, RuntimeError) as e:
+            print(f"   ⚠️  Whisper {compute_type} on {device} failed: {e}")
+
+    print("   Whisper: cpu (int8)")
+    return _load_whisper(size, "cpu", "int8")
+
+
+@functools.lru_cache(maxsize=None)
+def get_tts(device: str, compile_model: bool = True):
+    """Shared F5-TTS model; on CUDA the DiT transformer is compiled
+
+    The ODE sampler calls the transformer once per step: compile it (dynamic
+    shapes — text length varies). Compilation happens on the first synthesis.
+    """
+    import torch
+    from f5_tts.api import F5TTS
+
+    tts = F5TTS(device=device)
+    if compile_model and device == "cuda":
+        tts.ema_model.transformer = torch.compile(tts.ema_model.transformer, dynamic=True)
+        print("   F5-TTS: transformer compiled (torch.compile)")
+    return tts
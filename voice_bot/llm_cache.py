@@ -0,0 +1,104 @@
+"""
+Semantic cache for LLM responses
+Repeated or paraphrased prompts are answered from the cache instead of Ollama
+"""
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+# Optional: without faiss / sentence-transformers the cache is disabled
+try:
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    faiss = None
+    SentenceTransformer = None
+
+
+# Entries are grouped by generation config (see cache_context)
+CACHE_PATH = Path(__file__).parent / ".cache" / "llm_by_config.pkl"
+# Same small Russian model as the knowledge retriever (all-MiniLM is English-only)
+EMBEDDING_MODEL = "cointegrated/rubert-tiny2"
+SIMILARITY_THRESHOLD = 0.87
+
+
+def cache_context(model: str, system_prompt: str, options: dict) -> str:
+    """Key of the generation config: answers are only reused within the same one"""
+    return json.dumps(
+        {"model": model, "system": system_prompt, "options": options},
+        sort_keys=True, ensure_ascii=False
+    )
+
+
+class SemanticLLMCache:
+    """Cosine-similarity cache: (generation config, prompt embedding) -> response text
+
+    Each config (model, system prompt, options) has its own index, so a
+    different model or num_predict never gets another config's answer.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, threshold: float = SIMILARITY_THRESHOLD):
+        self.path = path
+        self.threshold = threshold
+        self.enabled = faiss is not None
+        # context -> {"embeddings": [...], "responses": [...]}
+        self.entries: dict[str, dict[str, list]] = {}
+        self.indexes: dict[str, "faiss.IndexFlatIP"] = {}
+
+        if not self.enabled:
+            print("⚠️  faiss / sentence-transformers not installed, LLM cache disabled")
+            return
+
+        self.embedder = SentenceTransformer(EMBEDDING_MODEL)
+        self._load()
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        return self.embedder.encode(prompt, normalize_embeddings=True).astype(np.float32)
+
+    def _index(self, context: str):
+        """Index of one generation config, created on first use"""
+        index = self.indexes.get(context)
+        if index is None:
+            # Normalized vectors: inner product == cosine similarity
+            index = faiss.IndexFlatIP(self.embedder.get_sentence_embedding_dimension())
+            self.indexes[context] = index
+            self.entries.setdefault(context, {"embeddings": [], "responses": []})
+        return index
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        with open(self.path, "rb") as f:
+            self.entries = pickle.load(f)
+        for context, entry in self.entries.items():
+            if entry["embeddings"]:
+                self._index(context).add(np.stack(entry["embeddings"]))
+
+    def _save(self):
+        self.path.parent.mkdir(exist_ok=True)
+        with open(self.path, "wb") as f:
+            pickle.dump(self.entries, f)
+
+    def get(self, prompt: str, context: str) -> str | None:
+        """Cached response for a similar prompt under the same config, or None"""
+        if not self.enabled:
+            return None
+        index = self.indexes.get(context)
+        if index is None or index.ntotal == 0:
+            return None
+        scores, ids = index.search(self._embed(prompt)[None], 1)
+        if scores[0, 0] >= self.threshold:
+            return self.entries[context]["responses"][ids[0, 0]]
+        return None
+
+    def put(self, prompt: str, response: str, context: str):
+        """Store response and persist the cache to disk"""
+        if not self.enabled:
+            return
+        embedding = self._embed(prompt)
+        self._index(context).add(embedding[None])
+        self.entries[context]["embeddings"].append(embedding)
+        self.entries[context]["responses"].append(response)
+        self._save()
@@ -0,0 +1,67 @@
+"""
+Benchmark int8 dynamic quantization of F5-TTS on CPU
+Quantizes only the Linear layers of the DiT (the vocoder stays FP32) and
+compares real-time factor against FP32 — keep FP32 if int8 is not faster
+"""
+import time
+import torch
+from torch import nn
+
+from f5_tts.api import F5TTS
+
+TEXTS = [
+    "Привет! Я голосовой ассистент.",
+    "Искусственный интеллект помогает решать сложные задачи.",
+    "Сегодня хорошая погода для прогулки.",
+]
+
+
+def quantize_dit(tts: F5TTS) -> F5TTS:
+    """Replace the DiT Linear layers with dynamically quantized int8 versions (CPU only)"""
+    tts.ema_model = torch.ao.quantization.quantize_dynamic(
+        tts.ema_model,
+        {nn.Linear},
+        dtype=torch.qint8
+    )
+    return tts
+
+
+def measure_rtf(tts: F5TTS) -> float:
+    """Average real-time factor over the test texts"""
+    rtfs = []
+    for text in TEXTS:
+        start = time.perf_counter()
+        audio, sample_rate, _ = tts.infer(ref_file=None, ref_text="", gen_text=text, seed=0)
+        rtfs.append((time.perf_counter() - start) / (len(audio) / sample_rate))
+    return sum(rtfs) / len(rtfs)
+
+
+def main():
+    print("=" * 50)
+    print("⚙️  F5-TTS int8 quantization benchmark (CPU)")
+    print("=" * 50)
+
+    tts = F5TTS(device="cpu")
+
+    # Warm-up so lazy init doesn't count against FP32
+    tts.infer(ref_file=None, ref_text="", gen_text="Привет.", seed=0)
+
+    print("\n🔄 FP32...")
+    fp32_rtf = measure_rtf(tts)
+    print(f"   RTF: {fp32_rtf:.2f}x")
+
+    print("\n🔄 int8 (dynamic, Linear only)...")
+    int8_rtf = measure_rtf(quantize_dit(tts))
+    print(f"   RTF: {int8_rtf:.2f}x")
+
+    print("\n" + "=" * 50)
+    if int8_rtf < fp32_rtf:
+        print(f"✅ int8 is {fp32_rtf / int8_rtf:.2f}x faster — use quantize_dit() on CPU")
+    else:
+        print("⚠️  int8 is not faster on this CPU — keep FP32")
+
+    return fp32_rtf, int8_rtf
+
+
+if __name__ == "__main__":
+    main()
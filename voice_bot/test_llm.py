@@ -2,44 +2,90 @@
 Test LLM with Ollama
 Tests response generation and streaming
 """
+import os
 import time
 import ollama
 from rich.console import Console
 from rich.live import Live
 from rich.text import Text
 
+from llm_cache import SemanticLLMCache, cache_context
+
 console = Console()
 
+SYSTEM_PROMPT = "Ты полезный ассистент. Отвечай кратко и по делу на русском языке."
 
-def test_llm_basic(model: str = "qwen2.5:7b"):
-    """Test basic LLM response"""
-    print("=" * 50)
-    print(f"🤖 LLM Test (Ollama - {model})")
-    print("=" * 50)
+# Keep the model loaded in Ollama between calls
+KEEP_ALIVE = "10m"
 
-    prompt = "Привет! Расскажи кратко, что такое искусственный интеллект?"
+# LLM_CACHE=1 answers repeated prompts from the semantic cache
+# (off by default: the timings below are meant to measure Ollama itself)
+_cache = SemanticLLMCache() if os.environ.get("LLM_CACHE") == "1" else None
 
-    print(f"\n📝 Prompt: {prompt}")
-    print("\n🔄 Generating response...")
 
-    start_time = time.time()
+def _run_stream(model: str, prompt: str, max_tokens: int = 128, echo: bool = True):
+    """Stream one response; return (text, time to first token, total time)"""
+    options = {"num_predict": max_tokens, "num_ctx": 1024, "temperature": 0.1}
+    context = cache_context(model, SYSTEM_PROMPT, options)
+    start_time = time.perf_counter()
+
+    if _cache is not None:
+        cached = _cache.get(prompt, context)
+        if cached is not None:
+            elapsed = time.perf_counter() - start_time
+            if echo:
+                print(cached, end="", flush=True)
+            return cached, elapsed, elapsed
 
-    response = ollama.chat(
+    first_token_time = None
+    full_response = ""
+
+    stream = ollama.chat(
         model=model,
         messages=[
             {
                 "role": "system",
-                "content": "Ты полезный ассистент. Отвечай кратко и по делу на русском языке."
+                "content": SYSTEM_PROMPT
             },
             {
                 "role": "user",
                 "content": prompt
             }
-        ]
+        ],
+        stream=True,
+        options=options,
+        keep_alive=KEEP_ALIVE
     )
 
-    elapsed = time.time() - start_time
-    text = response["message"]["content"]
+    for chunk in stream:
+        if first_token_time is None:
+            first_token_time = time.perf_counter() - start_time
+
+        content = chunk["message"]["content"]
+        full_response += content
+        if echo:
+            print(content, end="", flush=True)
+
+    elapsed = time.perf_counter() - start_time
+
+    if _cache is not None:
+        _cache.put(prompt, full_response, context)
+
+    return full_response, first_token_time, elapsed
+
+
+def test_llm_basic(model: str = "qwen2.5:7b"):
+    """Test basic LLM response"""
+    print("=" * 50)
+    print(f"🤖 LLM Test (Ollama - {model})")
+    print("=" * 50)
+
+    prompt = "Привет! Расскажи кратко, что такое искусственный интеллект?"
+
+    print(f"\n📝 Prompt: {prompt}")
+    print("\n🔄 Generating response...")
+
+    text, _, elapsed = _run_stream(model, prompt, echo=False)
 
     print("\n" + "=" * 50)
     print("📊 Results:")
@@ -61,34 +107,7 @@ def test_llm_streaming(model: str = "qwen2.5:7b"):
     print(f"\n📝 Prompt: {prompt}")
     print("\n🔄 Streaming response:\n")
 
-    start_time = time.time()
-    first_token_time = None
-    full_response = ""
-
-    stream = ollama.chat(
-        model=model,
-        messages=[
-            {
-                "role": "system",
-                "content": "Ты полезный ассистент. Отвечай кратко и по делу на русском языке."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
-        stream=True
-    )
-
-    for chunk in stream:
-        if first_token_time is None:
-            first_token_time = time.time() - start_time
-
-        content = chunk["message"]["content"]
-        full_response += content
-        print(content, end="", flush=True)
-
-    elapsed = time.time() - start_time
+    full_response, first_token_time, elapsed = _run_stream(model, prompt)
 
     print("\n\n" + "=" * 50)
     print("📊 Streaming Results:")
@@ -111,8 +130,7 @@ def test_llm():
     # Use available model
     model = "qwen2.5:7b"
 
-    # Run tests
-    test_llm_basic(model)
+    # One streaming run reports both total time and time to first token
     test_llm_streaming(model)
 
 
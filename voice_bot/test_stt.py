@@ -2,7 +2,10 @@
 Test Speech-to-Text with faster-whisper
 Records audio from microphone and transcribes it
 """
+import io
+import os
 import time
+from typing import Iterator
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
@@ -17,25 +20,51 @@ except ImportError:
     subprocess.run(["pip", "install", "faster-whisper"])
     from faster_whisper import WhisperModel
 
+from _models import get_whisper
+
 
 SAMPLE_RATE = 16000
 CHANNELS = 1
 AUDIO_DIR = Path(__file__).parent / "audio"
 AUDIO_DIR.mkdir(exist_ok=True)
+# WIPON_SAVE_AUDIO=1 also writes the recording to AUDIO_DIR (for debugging)
+SAVE_AUDIO = os.environ.get("WIPON_SAVE_AUDIO") == "1"
+
+# Reused recording buffer (up to 30 s); longer recordings get their own array.
+# Captured as int16 (the mic's native format), converted to float32 only for Whisper
+MAX_RECORD_SECONDS = 30
+_REC_BUFFER = np.empty((SAMPLE_RATE * MAX_RECORD_SECONDS, CHANNELS), dtype=np.int16)
+_F32_BUFFER = np.empty(SAMPLE_RATE * MAX_RECORD_SECONDS, dtype=np.float32)
+
+
+def get_model(size: str = "base") -> WhisperModel:
+    """Load Whisper model once and reuse it (shared with the pipeline)
+
+    Device and compute type are picked by get_whisper: GPU with the best
+    supported compute type, else CPU int8.
+    """
+    return get_whisper(size)
 
 
 def record_audio(duration: float = 5.0) -> np.ndarray:
-    """Record audio from microphone"""
+    """Record int16 audio from microphone
+
+    Returns a view into a shared buffer: the next call overwrites it,
+    so save or copy the audio before recording again.
+    """
     print(f"\n🎤 Recording for {duration} seconds... Speak now!")
+    n = int(duration * SAMPLE_RATE)
+    buf = _REC_BUFFER[:n] if n <= len(_REC_BUFFER) else None
     audio = sd.rec(
-        int(duration * SAMPLE_RATE),
+        n,
         samplerate=SAMPLE_RATE,
         channels=CHANNELS,
-        dtype=np.float32
+        dtype=np.int16,
+        out=buf
     )
     sd.wait()
     print("✅ Recording complete!")
-    return audio.flatten()
+    return audio.ravel()
 
 
 def save_audio(audio: np.ndarray, filename: str) -> Path:
@@ -45,21 +74,22 @@ def save_audio(audio: np.ndarray, filename: str) -> Path:
     return filepath
 
 
-def transcribe_audio(model: WhisperModel, audio_path: Path) -> tuple[str, float]:
-    """Transcribe audio file and return text with timing"""
-    start_time = time.time()
-
+def transcribe_audio(model: WhisperModel, audio: np.ndarray) -> Iterator[tuple[str, float]]:
+    """Transcribe mono 16 kHz audio, yielding (text, segment end) as segments are decoded"""
+    if audio.dtype == np.int16:
+        # One pass into the reused float32 buffer, no temporaries
+        out = _F32_BUFFER[:len(audio)] if len(audio) <= len(_F32_BUFFER) else None
+        audio = np.multiply(audio, 1.0 / 32768.0, out=out, dtype=np.float32)
     segments, info = model.transcribe(
-        str(audio_path),
+        audio,
         language="ru",  # Russian language
         beam_size=5,
         vad_filter=True,  # Voice activity detection
     )
 
-    text = " ".join([segment.text for segment in segments])
-    elapsed = time.time() - start_time
-
-    return text.strip(), elapsed
+    # segments is lazy: each one is decoded only when we ask for it
+    for segment in segments:
+        yield segment.text, segment.end
 
 
 def test_stt():
@@ -70,35 +100,45 @@ def test_stt():
 
     # Load model
     print("\n📥 Loading Whisper model (base)...")
-    model_start = time.time()
+    model_start = time.perf_counter()
 
     # Use 'base' for balance of speed/quality, 'small' or 'medium' for better quality
-    # compute_type: int8, float16, float32
-    model = WhisperModel(
-        "base",
-        device="cpu",  # or "cuda" for GPU
-        compute_type="int8"  # Faster on CPU
-    )
+    model = get_model("base")
 
-    print(f"✅ Model loaded in {time.time() - model_start:.2f}s")
+    print(f"✅ Model loaded in {time.perf_counter() - model_start:.2f}s "
+          f"on {model.model.device} ({model.model.compute_type})")
 
     # Record audio
     audio = record_audio(duration=5.0)
-    audio_path = save_audio(audio, "test_recording.wav")
-    print(f"💾 Audio saved to: {audio_path}")
+    duration = len(audio) / SAMPLE_RATE
+    if SAVE_AUDIO:
+        audio_path = save_audio(audio, "test_recording.wav")
+        print(f"💾 Audio saved to: {audio_path}")
 
     # Transcribe
-    print("\n🔄 Transcribing...")
-    text, transcribe_time = transcribe_audio(model, audio_path)
+    print("\n🔄 Transcribing...\n")
+    start_time = time.perf_counter()
+    first_segment_time = None
+    buf = io.StringIO()
+    for text_chunk, _ in transcribe_audio(model, audio):
+        if first_segment_time is None:
+            first_segment_time = time.perf_counter() - start_time
+        print(text_chunk, end="", flush=True)
+        buf.write(text_chunk)
+        buf.write(" ")
+    transcribe_time = time.perf_counter() - start_time
+    text = buf.getvalue().strip()
 
     # Results
     print("\n" + "=" * 50)
     print("📊 Results:")
     print("=" * 50)
     print(f"📝 Text: {text}")
+    if first_segment_time is not None:
+        print(f"⏱️  Time to first segment: {first_segment_time:.2f}s")
     print(f"⏱️  Transcription time: {transcribe_time:.2f}s")
-    print(f"📈 Audio duration: 5.0s")
-    print(f"🚀 Real-time factor: {transcribe_time / 5.0:.2f}x")
+    print(f"📈 Audio duration: {duration:.2f}s")
+    print(f"🚀 Real-time factor: {transcribe_time / duration:.2f}x")
 
     return text, transcribe_time
 
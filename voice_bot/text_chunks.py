@@ -0,0 +1,37 @@
+"""
+Split streamed LLM text into chunks for TTS
+No audio or model dependencies, so the splitting rules can be unit-tested
+"""
+import re
+
+# A sentence ends at . ! ? followed by whitespace, or at a newline.
+# A dot inside a token ("1.5", "8.3") is not an end, and neither is one at the
+# very end of the buffer: the next streamed token may continue the number.
+# A dot after a one-letter word is an abbreviation ("т.е.", "т.ч."); after a
+# single digit it is not ("Тарифов 5. Выберите")
+SENTENCE_END_RE = re.compile(r"(?:[!?]|(?<!\b[^\W\d])\.)[.!?]*(?=\s)|\n")
+
+# Until the first audio is queued, a clause this long is sent to TTS on its own.
+# Same rules for , ; : — whitespace after, and no digit before ("2,5 тысячи")
+CLAUSE_END_RE = re.compile(r"(?<!\d)[,;:](?=\s)")
+FIRST_CLAUSE_MIN_CHARS = 20
+
+
+def pop_sentences(buffer: str) -> tuple[str, str]:
+    """Split buffer into (completed sentences, unfinished tail)"""
+    end = -1
+    for match in SENTENCE_END_RE.finditer(buffer):
+        end = match.end()
+    if end < 0:
+        return "", buffer
+    return buffer[:end].strip(), buffer[end:]
+
+
+def pop_first_clause(buffer: str) -> tuple[str, str]:
+    """Split off a leading clause of at least FIRST_CLAUSE_MIN_CHARS, else ("", buffer)"""
+    end = -1
+    for match in CLAUSE_END_RE.finditer(buffer):
+        end = match.end()
+    if end < FIRST_CLAUSE_MIN_CHARS:
+        return "", buffer
+    return buffer[:end].strip(), buffer[end:]
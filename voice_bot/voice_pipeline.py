@@ -2,36 +2,75 @@
 Full Voice Bot Pipeline: STT -> LLM -> TTS
 Real-time voice conversation with F5-TTS
 """
+import collections
+import contextlib
+import io
+import queue
+import threading
 import time
 import torch
 import numpy as np
 import sounddevice as sd
-import soundfile as sf
 import ollama
 from pathlib import Path
 from dataclasses import dataclass
 
-from faster_whisper import WhisperModel
-from f5_tts.api import F5TTS
+from f5_tts.infer.utils_infer import preprocess_ref_audio_text
+
+from _models import get_tts, get_whisper
+from text_chunks import pop_first_clause, pop_sentences
 
 
 SAMPLE_RATE = 16000
+
+# Recording stops after this much silence following speech (energy-based VAD)
+BLOCK_SIZE = SAMPLE_RATE // 4  # 250 ms blocks
+SPEECH_RMS_THRESHOLD = 0.01 * 32768  # in int16 units
+END_SILENCE_SEC = 0.5
+# No block from the microphone for this long means the device stalled or disconnected
+INPUT_TIMEOUT_SEC = 4 * BLOCK_SIZE / SAMPLE_RATE
+# Recording and its float32 copy for Whisper go into buffers preallocated for this length
+MAX_RECORD_SECONDS = 30
 AUDIO_DIR = Path(__file__).parent / "audio"
 AUDIO_DIR.mkdir(exist_ok=True)
 
 # Optional reference audio for voice cloning
 REFERENCE_AUDIO = AUDIO_DIR / "reference.wav"
 
+# Keep the LLM loaded in Ollama between turns; bound generation to short answers
+LLM_KEEP_ALIVE = "30m"
+LLM_OPTIONS = {"num_predict": 120, "temperature": 0.5, "num_ctx": 1024}
+
+# F5-TTS output rate; playback goes through one persistent output stream
+TTS_SAMPLE_RATE = 24000
+OUTPUT_BLOCK_SIZE = 1024
+
+# Synthesized audio is kept for recent texts; short stock replies are
+# synthesized during warm-up so they never wait for TTS
+TTS_CACHE_SIZE = 64
+CANNED_PHRASES = ("Привет.", "Здравствуйте!", "Хорошо.", "Понятно.", "Секунду.", "Спасибо!")
+
+
+def cpu_supports_bf16() -> bool:
+    """CPU has native bf16 (AVX-512 BF16 or AMX) — Linux only, False elsewhere"""
+    try:
+        with open("/proc/cpuinfo") as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return "avx512_bf16" in flags or "amx_bf16" in flags
+
 
 @dataclass
 class PipelineMetrics:
-    """Timing metrics for the pipeline"""
+    """Timing metrics for the pipeline (perf_counter deltas, seconds)"""
     stt_time: float = 0.0
     llm_time: float = 0.0
     llm_first_token: float = 0.0
     tts_time: float = 0.0
+    first_audio_time: float = 0.0
     total_time: float = 0.0
-    audio_input_duration: float = 0.0
+    audio_input_duration: float = 0.0  # recorded length, after the VAD stop
     audio_output_duration: float = 0.0
 
     def print_summary(self):
@@ -42,11 +81,12 @@ class PipelineMetrics:
         print(f"🤖 LLM first token:    {self.llm_first_token:.2f}s")
         print(f"🤖 LLM total time:     {self.llm_time:.2f}s")
         print(f"🔊 TTS time:           {self.tts_time:.2f}s")
+        print(f"▶️  First audio:        {self.first_audio_time:.2f}s")
         print("-" * 60)
         print(f"⏱️  Total pipeline:     {self.total_time:.2f}s")
         print(f"🎤 Input audio:        {self.audio_input_duration:.2f}s")
         print(f"🔊 Output audio:       {self.audio_output_duration:.2f}s")
-        print(f"⚡ Latency (to speech): {self.stt_time + self.llm_time + self.tts_time:.2f}s")
+        print(f"⚡ Latency (to speech): {self.stt_time + self.first_audio_time:.2f}s")
 
 
 class VoicePipeline:
@@ -56,6 +96,7 @@ class VoicePipeline:
         self,
         whisper_model: str = "base",
         llm_model: str = "qwen2.5:7b",
+        warmup: bool = True,
     ):
         self.llm_model = llm_model
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -67,24 +108,76 @@ class VoicePipeline:
 
         # Initialize STT
         print("\n📥 Loading Whisper model...")
-        stt_start = time.time()
-        self.stt = WhisperModel(
-            whisper_model,
-            device="cpu",
-            compute_type="int8"
-        )
-        print(f"   ✅ Whisper loaded in {time.time() - stt_start:.2f}s")
+        stt_start = time.perf_counter()
+        self.stt = get_whisper(whisper_model)
+        print(f"   ✅ Whisper loaded in {time.perf_counter() - stt_start:.2f}s")
 
         # Initialize TTS (F5-TTS)
         print("\n📥 Loading F5-TTS model...")
-        tts_start = time.time()
-        self.tts = F5TTS(device=self.device)
-        print(f"   ✅ F5-TTS loaded in {time.time() - tts_start:.2f}s")
+        tts_start = time.perf_counter()
+        self.tts = get_tts(self.device)
+        print(f"   ✅ F5-TTS loaded in {time.perf_counter() - tts_start:.2f}s")
+
+        # Reused per turn: int16 recording and its float32 conversion for Whisper
+        self._rec_buf = np.empty(SAMPLE_RATE * MAX_RECORD_SECONDS, dtype=np.int16)
+        self._f32_buf = np.empty(SAMPLE_RATE * MAX_RECORD_SECONDS, dtype=np.float32)
+
+        # Playback: the stream callback pulls queued audio, so synthesis of the
+        # next sentence never waits for the current one to finish playing
+        self._out_chunks: collections.deque = collections.deque()
+        self._out_pending = np.zeros(0, dtype=np.float32)
+        self._out_lock = threading.Lock()
+        self._out_drained = threading.Event()
+        self._out_drained.set()
+        # Set by the callback when queued audio first reaches the device
+        self._first_output_time = None
+        self.out_stream = sd.OutputStream(
+            samplerate=TTS_SAMPLE_RATE,
+            channels=1,
+            dtype="float32",
+            blocksize=OUTPUT_BLOCK_SIZE,
+            callback=self._audio_callback
+        )
+        self.out_stream.start()
+
+        # TF32 tensor cores for whatever still runs in fp32
+        torch.set_float32_matmul_precision("high")
+
+        # Half-precision autocast for TTS: bf16 on Ampere+ and on CPUs with
+        # native bf16 (oneDNN kernels), fp16 on older GPUs
+        self.tts_autocast_dtype = None
+        if self.device == "cuda":
+            major, _ = torch.cuda.get_device_capability()
+            self.tts_autocast_dtype = torch.bfloat16 if major >= 8 else torch.float16
+        elif cpu_supports_bf16():
+            self.tts_autocast_dtype = torch.bfloat16
+        if self.tts_autocast_dtype is not None:
+            print(f"   F5-TTS: {self.device} autocast ({self.tts_autocast_dtype})")
 
         # Reference audio for voice cloning (optional)
         self.ref_audio = str(REFERENCE_AUDIO) if REFERENCE_AUDIO.exists() else None
+        self.ref_text = ""
         if self.ref_audio:
             print(f"   Using reference voice: {REFERENCE_AUDIO.name}")
+            # Clip and transcribe the reference once, not on every synthesis
+            self.ref_audio, self.ref_text = preprocess_ref_audio_text(self.ref_audio, "")
+
+        # text -> (audio, sample rate), least recently used first
+        self._tts_cache: collections.OrderedDict = collections.OrderedDict()
+
+        # The first synthesis pays for lazy init (vocoder, CUDA kernels,
+        # transformer compilation); do it here so the first conversation turn doesn't.
+        # The canned phrases land in the TTS cache along the way
+        if warmup:
+            print("\n🔥 Warming up F5-TTS...")
+            warmup_time = sum(self.text_to_speech(phrase)[2] for phrase in CANNED_PHRASES)
+            print(f"   ✅ Warm-up done in {warmup_time:.2f}s ({len(CANNED_PHRASES)} phrases cached)")
+
+        # Preload the LLM so the first turn doesn't pay for loading it from disk
+        print("\n📥 Loading LLM into Ollama...")
+        llm_start = time.perf_counter()
+        ollama.generate(model=self.llm_model, prompt="", keep_alive=LLM_KEEP_ALIVE)
+        print(f"   ✅ {self.llm_model} loaded in {time.perf_counter() - llm_start:.2f}s")
 
         # System prompt
         self.system_prompt = """Ты голосовой ассистент. Отвечай кратко и естественно, как в разговоре.
@@ -94,63 +187,188 @@ class VoicePipeline:
         print("\n✅ Pipeline ready!")
 
     def record_audio(self, duration: float = 5.0) -> np.ndarray:
-        """Record audio from microphone"""
-        print(f"\n🎤 Recording ({duration}s)... Speak now!")
-        audio = sd.rec(
-            int(duration * SAMPLE_RATE),
+        """Record int16 audio from microphone until the speaker goes quiet (at most `duration` seconds)
+
+        Returns a view into a reused buffer: the next call overwrites it.
+        Raises TimeoutError if the input device stops delivering audio.
+        """
+        print(f"\n🎤 Recording (up to {duration}s)... Speak now!")
+        blocks: queue.Queue = queue.Queue()
+
+        def callback(indata, frames, time_info, status):
+            # Don't print from the audio thread: status is reported by the loop below
+            blocks.put((indata[:, 0].copy(), status))
+
+        max_blocks = max(1, int(min(duration, MAX_RECORD_SECONDS) * SAMPLE_RATE) // BLOCK_SIZE)
+        n_blocks = 0
+        end_silence_blocks = max(1, int(END_SILENCE_SEC * SAMPLE_RATE) // BLOCK_SIZE)
+        heard_speech = False
+        silent_blocks = 0
+
+        with sd.InputStream(
             samplerate=SAMPLE_RATE,
             channels=1,
-            dtype=np.float32
-        )
-        sd.wait()
+            dtype=np.int16,
+            blocksize=BLOCK_SIZE,
+            callback=callback
+        ):
+            while n_blocks < max_blocks:
+                try:
+                    block, status = blocks.get(timeout=INPUT_TIMEOUT_SEC)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No audio from the input device for {INPUT_TIMEOUT_SEC:.1f}s "
+                        "(stalled or disconnected?)"
+                    ) from None
+                if status:
+                    print(f"\n⚠️  Input stream: {status}")
+                self._rec_buf[n_blocks * BLOCK_SIZE:(n_blocks + 1) * BLOCK_SIZE] = block
+                n_blocks += 1
+                # Square in float32: int16 squares overflow
+                rms = np.sqrt(np.mean(np.square(block, dtype=np.float32)))
+                if rms >= SPEECH_RMS_THRESHOLD:
+                    heard_speech = True
+                    silent_blocks = 0
+                elif heard_speech:
+                    silent_blocks += 1
+                    if silent_blocks >= end_silence_blocks:
+                        break
+
         print("✅ Recording complete")
-        return audio.flatten()
+        return self._rec_buf[:n_blocks * BLOCK_SIZE]
 
     def speech_to_text(self, audio: np.ndarray) -> tuple[str, float]:
-        """Convert speech to text"""
-        temp_path = AUDIO_DIR / "temp_input.wav"
-        sf.write(temp_path, audio, SAMPLE_RATE)
-
-        start = time.time()
+        """Convert speech (int16 or float32 mono 16 kHz) to text"""
+        start = time.perf_counter()
+        if audio.dtype == np.int16:
+            # One pass into the reused float32 buffer, no temporaries
+            out = self._f32_buf[:len(audio)] if len(audio) <= len(self._f32_buf) else None
+            audio = np.multiply(audio, 1.0 / 32768.0, out=out, dtype=np.float32)
+        # Short conversational turns: greedy decoding without timestamps
+        # is several times cheaper than beam search for about the same text
         segments, _ = self.stt.transcribe(
-            str(temp_path),
+            audio,
             language="ru",
-            beam_size=5,
-            vad_filter=True
+            beam_size=1,
+            temperature=0.0,
+            condition_on_previous_text=False,
+            without_timestamps=True,
+            vad_filter=True,
+            vad_parameters={"min_silence_duration_ms": 300}
         )
-        text = " ".join([s.text for s in segments]).strip()
-        elapsed = time.time() - start
+        buf = io.StringIO()
+        for segment in segments:
+            buf.write(segment.text)
+            buf.write(" ")
+        text = buf.getvalue().strip()
+        elapsed = time.perf_counter() - start
 
         return text, elapsed
 
     def text_to_speech(self, text: str) -> tuple[np.ndarray, int, float]:
-        """Convert text to speech using F5-TTS"""
-        start = time.time()
-
-        audio, sample_rate, _ = self.tts.infer(
-            ref_file=self.ref_audio,
-            ref_text="",
-            gen_text=text,
-            seed=-1,
+        """Convert text to speech using F5-TTS (repeated texts come from the cache)"""
+        start = time.perf_counter()
+        key = text.strip()
+        cached = self._tts_cache.get(key)
+        if cached is not None:
+            self._tts_cache.move_to_end(key)
+            audio, sample_rate = cached
+            return audio, sample_rate, time.perf_counter() - start
+
+        autocast = (
+            torch.autocast(self.device, dtype=self.tts_autocast_dtype)
+            if self.tts_autocast_dtype is not None else contextlib.nullcontext()
         )
-
-        elapsed = time.time() - start
+        with autocast:
+            audio, sample_rate, _ = self.tts.infer(
+                ref_file=self.ref_audio,
+                ref_text=self.ref_text,
+                gen_text=text,
+                seed=-1,
+            )
+
+        self._tts_cache[key] = (audio, sample_rate)
+        if len(self._tts_cache) > TTS_CACHE_SIZE:
+            self._tts_cache.popitem(last=False)
+        elapsed = time.perf_counter() - start
 
         return audio, sample_rate, elapsed
 
-    def play_audio(self, audio: np.ndarray, sample_rate: int = 24000):
-        """Play audio"""
-        sd.play(audio, sample_rate)
-        sd.wait()
+    def _audio_callback(self, outdata, frames, time_info, status):
+        """Output stream callback: fill the block from queued audio, silence if none"""
+        out = outdata[:, 0]
+        filled = 0
+        with self._out_lock:
+            while filled < frames:
+                if not len(self._out_pending):
+                    if not self._out_chunks:
+                        break
+                    self._out_pending = self._out_chunks.popleft()
+                n = min(frames - filled, len(self._out_pending))
+                out[filled:filled + n] = self._out_pending[:n]
+                self._out_pending = self._out_pending[n:]
+                filled += n
+            if filled and self._first_output_time is None:
+                self._first_output_time = time.perf_counter()
+            if filled < frames:
+                out[filled:] = 0
+                self._out_drained.set()
+
+    def play_audio(self, audio: np.ndarray, sample_rate: int = TTS_SAMPLE_RATE):
+        """Queue audio for playback (returns immediately; see wait_playback)"""
+        if sample_rate != TTS_SAMPLE_RATE:
+            # Not the stream's rate — play it on its own
+            sd.play(audio, sample_rate)
+            sd.wait()
+            return
+        with self._out_lock:
+            self._out_chunks.append(np.asarray(audio, dtype=np.float32).ravel())
+            self._out_drained.clear()
+
+    def wait_playback(self):
+        """Block until all queued audio has been played"""
+        self._out_drained.wait()
+        time.sleep(self.out_stream.latency)
+
+    def close(self):
+        """Stop the output stream"""
+        self.out_stream.stop()
+        self.out_stream.close()
+
+    def _tts_worker(self, sentences: queue.Queue, metrics: PipelineMetrics, start: float,
+                    errors: list):
+        """Synthesize sentences as they arrive and queue them for playback; None ends the stream
+
+        An exception stops the worker and is appended to errors, so that
+        run_conversation can re-raise it after join().
+        """
+        try:
+            while (sentence := sentences.get()) is not None:
+                audio, sr, tts_time = self.text_to_speech(sentence)
+                metrics.tts_time += tts_time
+                metrics.audio_output_duration += len(audio) / sr
+                if not metrics.first_audio_time:
+                    # Queued; replaced by the actual playback start when known
+                    metrics.first_audio_time = time.perf_counter() - start
+                self.play_audio(audio, sr)
+        except Exception as e:
+            errors.append(e)
 
     def run_conversation(self, record_duration: float = 5.0) -> PipelineMetrics:
-        """Run full conversation pipeline"""
+        """Run full conversation pipeline
+
+        LLM, TTS and playback overlap: each completed sentence is synthesized
+        while the LLM keeps generating, and queued on the output stream
+        while the next one is synthesized.
+        The first clause goes to TTS before its sentence ends, so audio
+        starts after one short synthesis rather than a whole sentence.
+        """
         metrics = PipelineMetrics()
-        pipeline_start = time.time()
+        pipeline_start = time.perf_counter()
 
         # Step 1: Record
         audio_input = self.record_audio(record_duration)
-        metrics.audio_input_duration = record_duration
+        metrics.audio_input_duration = len(audio_input) / SAMPLE_RATE
 
         # Step 2: STT
         print("\n🔄 Transcribing...")
@@ -162,43 +380,71 @@ class VoicePipeline:
             print("⚠️  No speech detected")
             return metrics
 
-        # Step 3: LLM (with streaming output)
-        print("\n🤖 Assistant: ", end="", flush=True)
-        llm_start = time.time()
-        first_token_time = None
-        full_response = ""
-
-        stream = ollama.chat(
-            model=self.llm_model,
-            messages=[
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": user_text}
-            ],
-            stream=True
+        # Steps 3-5: LLM -> TTS -> output stream, connected by queues
+        sentences: queue.Queue = queue.Queue()
+        tts_errors: list = []
+        self._first_output_time = None
+        llm_start = time.perf_counter()
+        tts_thread = threading.Thread(
+            target=self._tts_worker, args=(sentences, metrics, llm_start, tts_errors),
+            daemon=True
         )
+        tts_thread.start()
 
-        for chunk in stream:
-            if first_token_time is None:
-                first_token_time = time.time() - llm_start
-            content = chunk["message"]["content"]
-            full_response += content
-            print(content, end="", flush=True)
+        print("\n🤖 Assistant: ", end="", flush=True)
+        first_token_time = None
+        pending = ""
+        queued_any = False
+
+        # The None sentinel always goes out, so the TTS worker can't block
+        # forever on get() when the LLM request fails
+        try:
+            stream = ollama.chat(
+                model=self.llm_model,
+                messages=[
+                    {"role": "system", "content": self.system_prompt},
+                    {"role": "user", "content": user_text}
+                ],
+                stream=True,
+                options=LLM_OPTIONS,
+                keep_alive=LLM_KEEP_ALIVE
+            )
+
+            for chunk in stream:
+                if first_token_time is None:
+                    first_token_time = time.perf_counter() - llm_start
+                content = chunk["message"]["content"]
+                print(content, end="", flush=True)
+                completed, pending = pop_sentences(pending + content)
+                if not completed and not queued_any:
+                    completed, pending = pop_first_clause(pending)
+                if completed:
+                    sentences.put(completed)
+                    queued_any = True
+
+            if pending.strip():
+                sentences.put(pending.strip())
+        finally:
+            sentences.put(None)
 
         print()
         metrics.llm_first_token = first_token_time or 0
-        metrics.llm_time = time.time() - llm_start
-
-        # Step 4: TTS
-        print("\n🔊 Synthesizing speech...")
-        audio_output, sr, tts_time = self.text_to_speech(full_response)
-        metrics.tts_time = tts_time
-        metrics.audio_output_duration = len(audio_output) / sr
-
-        # Step 5: Play
-        print("▶️  Playing response...")
-        self.play_audio(audio_output, sr)
-
-        metrics.total_time = time.time() - pipeline_start
+        metrics.llm_time = time.perf_counter() - llm_start
+
+        # Wait for the remaining sentences to be synthesized and played
+        tts_thread.join()
+        if tts_errors:
+            raise tts_errors[0]
+        self.wait_playback()
+
+        # First audio = first samples handed to the device plus its output latency,
+        # not the moment a synthesized sentence was queued
+        if self._first_output_time is not None:
+            metrics.first_audio_time = (
+                self._first_output_time + self.out_stream.latency - llm_start
+            )
+
+        metrics.total_time = time.perf_counter() - pipeline_start
         return metrics
 
 
@@ -216,7 +462,7 @@ def main():
 
     print("\n" + "=" * 60)
     print("📢 Ready for conversation!")
-    print("   Press Enter to start recording (5 seconds)")
+    print("   Press Enter to start recording (up to 5 seconds, stops when you pause)")
     print("   Type 'q' to quit")
     print("=" * 60)
 
@@ -224,9 +470,14 @@ def main():
         user_input = input("\n⏎ Press Enter to speak (or 'q' to quit): ")
         if user_input.lower() == 'q':
             print("👋 Goodbye!")
+            pipeline.close()
             break
 
-        metrics = pipeline.run_conversation(record_duration=5.0)
+        try:
+            metrics = pipeline.run_conversation(record_duration=5.0)
+        except TimeoutError as e:
+            print(f"⚠️  Recording failed: {e}")
+            continue
         metrics.print_summary()
 
 